@@ -5,7 +5,11 @@ Fully async architecture without threading
 
 import os
 import asyncio
+import heapq
+import logging
 import signal
+from collections import deque
+from operator import attrgetter
 import sys
 from datetime import datetime, timezone, time, timedelta
 from dotenv import load_dotenv
@@ -15,17 +19,16 @@ from typing import List, Dict, Optional, Any
 from rss_parser import AsyncRSSParser
 from models_v2 import Article, SlackConfig, DigestSchedule
 from async_slack_bot_fixed import AsyncSlackBot
-from llm_summarizer import create_summarizer
 from logger_config import setup_logging, get_logger
 from utils.single_instance import SingleInstance
 from utils.cache_manager import CacheManager
 from database.manager import DatabaseManager
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Configure structured logging
-setup_logging()
 logger = get_logger(__name__)
 
 
@@ -49,9 +52,11 @@ class AsyncAINewsBot:
 
         # LLM configuration
         self.llm_backend = os.getenv('LLM_BACKEND', 'ollama')
-        self.llm_model = os.getenv('LLM_MODEL', 'llama3.2')
+        self.llm_model = os.getenv('LLM_MODEL', 'llama3.2:3b-instruct-q4_K_M')
         self.llm_base_url = os.getenv('LLM_BASE_URL', 'http://localhost:11434')
         self.enable_summaries = os.getenv('ENABLE_LLM_SUMMARIES', 'true').lower() == 'true'
+        # Defaults to the Ollama server's parallel slots so in-flight requests batch together
+        self.llm_concurrency = int(os.getenv('LLM_CONCURRENCY', os.getenv('OLLAMA_NUM_PARALLEL', 4)))
 
         # Initialize components
         self.rss_parser = AsyncRSSParser()
@@ -68,6 +73,7 @@ class AsyncAINewsBot:
         self.summarizer = None
         if self.enable_summaries:
             try:
+                from llm_summarizer import create_summarizer
                 if self.llm_backend in ['transformer', 'flan-t5']:
                     self.summarizer = create_summarizer(
                         backend=self.llm_backend,
@@ -98,6 +104,7 @@ class AsyncAINewsBot:
             feeds_count=len(self.rss_feeds),
             keywords_count=len(self.ai_keywords),
             llm_backend=self.llm_backend,
+            llm_concurrency=self.llm_concurrency,
             summaries_enabled=self.enable_summaries
         )
 
@@ -106,8 +113,8 @@ class AsyncAINewsBot:
         digest_file = "digest_config.json"
         if os.path.exists(digest_file):
             try:
-                with open(digest_file, 'r') as f:
-                    data = json.load(f)
+                with open(digest_file, 'rb') as f:
+                    data = orjson.loads(f.read()) if orjson else json.load(f)
                     return data
             except Exception as e:
                 logger.error(f"Error loading digest config: {e}")
@@ -116,8 +123,12 @@ class AsyncAINewsBot:
     def _save_digest_config(self):
         """Save digest configuration to file"""
         try:
-            with open("digest_config.json", 'w') as f:
-                json.dump(self.digest_config, f, indent=2)
+            if orjson:
+                with open("digest_config.json", 'wb') as f:
+                    f.write(orjson.dumps(self.digest_config, option=orjson.OPT_INDENT_2))
+            else:
+                with open("digest_config.json", 'w') as f:
+                    json.dump(self.digest_config, f, indent=2)
         except Exception as e:
             logger.error(f"Error saving digest config: {e}")
 
@@ -164,67 +175,66 @@ class AsyncAINewsBot:
         # Group articles by source
         articles_by_source: Dict[str, List[Article]] = {}
         for article in articles:
-            source = article.feed_name
-            if source not in articles_by_source:
-                articles_by_source[source] = []
-            articles_by_source[source].append(article)
-
-        # Sort each source's articles by date
-        for source in articles_by_source:
-            articles_by_source[source].sort(
-                key=lambda x: x.published or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True
-            )
+            articles_by_source.setdefault(article.feed_name, []).append(article)
+
+        # One newest-first queue per source, visited in name order; no source
+        # can contribute more than max_articles, so only those are ranked
+        source_queues = deque(
+            deque(heapq.nlargest(
+                max_articles,
+                source_articles,
+                key=attrgetter('sort_ts')
+            ))
+            for _, source_articles in sorted(articles_by_source.items())
+        )
 
-        # Round-robin selection from each source
+        # Round-robin selection: take one article and requeue the source if it has more
         selected = []
-        source_indices = {source: 0 for source in articles_by_source}
-
-        while len(selected) < max_articles:
-            added_this_round = False
-            for source in sorted(articles_by_source.keys()):  # Sort for consistent ordering
-                if source_indices[source] < len(articles_by_source[source]):
-                    selected.append(articles_by_source[source][source_indices[source]])
-                    source_indices[source] += 1
-                    added_this_round = True
-                    if len(selected) >= max_articles:
-                        break
-
-            # If no articles were added this round, all sources are exhausted
-            if not added_this_round:
-                break
+        while source_queues and len(selected) < max_articles:
+            queue = source_queues.popleft()
+            selected.append(queue.popleft())
+            if queue:
+                source_queues.append(queue)
 
         logger.info(f"Selected {len(selected)} articles from {len(articles_by_source)} sources")
         return selected
 
     async def generate_summaries_batch(self, articles: List[Article]) -> None:
-        """Generate summaries for articles"""
+        """Generate summaries for articles concurrently"""
         if not self.summarizer:
             return
 
         logger.info(f"Generating AI summaries for {len(articles)} articles...")
 
-        # Process summaries sequentially
-        for article in articles:
-            try:
-                # Convert Article to dict for summarizer compatibility
-                article_dict = {
-                    'id': article.id,
-                    'title': article.title,
-                    'summary': article.summary,
-                    'feed_name': article.feed_name,
-                    'category': article.category
-                }
-                summary = self.summarizer.summarize(article_dict)
-                if summary:
-                    article.ai_summary = summary
-            except Exception as e:
-                logger.warning_with_context(
-                    "Failed to summarize article",
-                    article_title=article.title[:50],
-                    article_id=article.id,
-                    error=str(e)
-                )
+        # Convert Article to dict for summarizer compatibility
+        article_dicts = [
+            {
+                'id': article.id,
+                'title': article.title,
+                'summary': article.summary,
+                'feed_name': article.feed_name,
+                'category': article.category
+            }
+            for article in articles
+        ]
+
+        # HTTP backends keep up to llm_concurrency requests in flight;
+        # local models run the list as one batch in a worker thread
+        try:
+            summaries = await self.summarizer.asummarize_many(
+                article_dicts, concurrency=self.llm_concurrency
+            )
+        except Exception as e:
+            logger.warning_with_context(
+                "Failed to summarize articles",
+                articles_count=len(articles),
+                error=str(e)
+            )
+            return
+
+        for article, summary in zip(articles, summaries):
+            if summary:
+                article.ai_summary = summary
 
     async def handle_latest_articles_request(self, command: Dict):
         """Handle slash command request for latest articles"""
@@ -267,13 +277,13 @@ class AsyncAINewsBot:
                 # If no articles in last 48 hours, get the 5 most recent regardless
                 recent_articles = sorted(
                     all_articles,
-                    key=lambda x: x.published or datetime.min.replace(tzinfo=timezone.utc),
+                    key=attrgetter('sort_ts'),
                     reverse=True
                 )[:10]  # Get top 10 most recent
 
             # Sort by date (newest first)
             recent_articles.sort(
-                key=lambda x: x.published or datetime.min.replace(tzinfo=timezone.utc),
+                key=attrgetter('sort_ts'),
                 reverse=True
             )
 
@@ -316,11 +326,12 @@ class AsyncAINewsBot:
             # The RSS parser already returns Article objects, no conversion needed
 
             if new_articles:
-                logger.info_with_context(
-                    "Found new articles",
-                    articles_count=len(new_articles),
-                    sources=list(set(a.feed_name for a in new_articles))
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info_with_context(
+                        "Found new articles",
+                        articles_count=len(new_articles),
+                        sources=sorted({a.feed_name for a in new_articles})
+                    )
 
                 # Limit articles per update
                 max_articles_per_update = int(os.getenv('MAX_ARTICLES_PER_UPDATE', 10))
@@ -391,7 +402,7 @@ class AsyncAINewsBot:
 
             # Sort by priority score and date
             recent_articles.sort(
-                key=lambda x: (x.priority_score, x.published or datetime.min.replace(tzinfo=timezone.utc)),
+                key=attrgetter('priority_score', 'sort_ts'),
                 reverse=True
             )
 
@@ -539,17 +550,25 @@ class AsyncAINewsBot:
         if self.digest_config.get('enabled'):
             self.digest_task = asyncio.create_task(self._run_digest_scheduler())
 
+        loop = asyncio.get_running_loop()
+        next_check = loop.time() + self.check_interval * 60
+
         # Keep running
         while not self.shutdown_event.is_set():
-            # Wait for the specified interval or shutdown signal
+            # Wait until the next deadline or shutdown signal
             try:
                 await asyncio.wait_for(
                     self.shutdown_event.wait(),
-                    timeout=self.check_interval * 60
+                    timeout=max(0, next_check - loop.time())
                 )
             except asyncio.TimeoutError:
                 # Normal timeout, check feeds
                 await self.check_feeds_async()
+                # Advance from the deadline, not the finish time, so checks don't drift
+                next_check += self.check_interval * 60
+                if next_check <= loop.time():
+                    # A check overran a whole interval; skip the missed tick
+                    next_check = loop.time() + self.check_interval * 60
 
     async def start(self):
         """Start the bot with fully async architecture"""
@@ -566,6 +585,13 @@ class AsyncAINewsBot:
         # Clean expired database cache
         await self.db_manager.clean_expired_cache()
 
+        # Load the LLM before the first feed check needs it
+        if self.summarizer:
+            try:
+                await asyncio.to_thread(self.summarizer.warmup)
+            except Exception as e:
+                logger.warning(f"LLM warmup failed: {e}")
+
         # Create tasks for parallel execution
         tasks = [
             asyncio.create_task(self.slack_bot.start()),
@@ -603,6 +629,11 @@ class AsyncAINewsBot:
         # Stop Slack bot
         await self.slack_bot.stop()
 
+        # Close feed and LLM connections
+        await self.rss_parser.close()
+        if self.summarizer:
+            await self.summarizer.aclose()
+
         # Close database connections
         await self.db_manager.close()
 
@@ -636,6 +667,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Process-wide setup stays out of import time; spawned parse workers
+    # re-import this module as __mp_main__
+    load_dotenv()
+    setup_logging()
+    
     # Ensure single instance
     with SingleInstance('/tmp/slackwire.lock'):
         asyncio.run(main())
\ No newline at end of file
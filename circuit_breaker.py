@@ -43,11 +43,7 @@ class CircuitBreaker:
         
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection"""
-        if self.state == CircuitState.OPEN:
-            if self._should_attempt_reset():
-                self._transition_to_half_open()
-            else:
-                raise Exception(f"Circuit breaker is OPEN. Service unavailable until {self._get_recovery_time()}")
+        self._before_call()
                 
         try:
             result = func(*args, **kwargs)
@@ -57,6 +53,26 @@ class CircuitBreaker:
             self._on_failure()
             raise e
             
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Await a coroutine function with circuit breaker protection"""
+        self._before_call()
+        
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+        except self.config.exception_types as e:
+            self._on_failure()
+            raise e
+            
+    def _before_call(self):
+        """Block the call while open, or move to half-open once recovery is due"""
+        if self.state == CircuitState.OPEN:
+            if self._should_attempt_reset():
+                self._transition_to_half_open()
+            else:
+                raise Exception(f"Circuit breaker is OPEN. Service unavailable until {self._get_recovery_time()}")
+            
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt recovery"""
         if self.last_failure_time is None:
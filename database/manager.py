@@ -229,6 +229,59 @@ class DatabaseManager:
                 logger.error(f"Error saving feedback: {e}")
                 return False
 
+    async def save_feedback_bulk(self, feedback: List[Dict[str, Any]]) -> int:
+        """Upsert many feedback rows in one transaction; returns rows written"""
+        if not feedback:
+            return 0
+
+        async with self.get_session() as session:
+            try:
+                # Resolve article hashes to ids with a single query
+                hashes = {f['article_id'] for f in feedback if not self._is_uuid(f['article_id'])}
+                ids_by_hash = {}
+                if hashes:
+                    stmt = select(ArticleDB.article_hash, ArticleDB.id).where(
+                        ArticleDB.article_hash.in_(hashes)
+                    )
+                    ids_by_hash = dict((await session.execute(stmt)).all())
+
+                timestamp = datetime.now(timezone.utc).isoformat()
+                rows = {}
+                for f in feedback:
+                    article_id = f['article_id']
+                    if self._is_uuid(article_id):
+                        article_uuid = uuid.UUID(article_id)
+                    else:
+                        article_uuid = ids_by_hash.get(article_id)
+                    if article_uuid is None:
+                        continue
+                    # One row per user and article; later entries win as with save_feedback
+                    rows[(article_uuid, f['user_id'])] = {
+                        'article_id': article_uuid,
+                        'user_id': f['user_id'],
+                        'is_positive': f['is_positive'],
+                        'feed_name': f.get('feed_name'),
+                        'feedback_metadata': {'timestamp': timestamp}
+                    }
+
+                values = list(rows.values())
+                # Stay well under the driver's bind parameter limit
+                for start in range(0, len(values), 1000):
+                    stmt = insert(FeedbackDB).values(values[start:start + 1000])
+                    stmt = stmt.on_conflict_do_update(
+                        constraint='unique_user_article_feedback',
+                        set_=dict(
+                            is_positive=stmt.excluded.is_positive,
+                            timestamp=func.now()
+                        )
+                    )
+                    await session.execute(stmt)
+                return len(values)
+
+            except Exception as e:
+                logger.error(f"Error saving feedback batch: {e}")
+                return 0
+
     async def get_article_feedback_stats(self, article_id: str) -> Tuple[int, int]:
         """Get positive and negative feedback counts for an article"""
         async with self.get_session() as session:
@@ -3,49 +3,159 @@ import os
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
-from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
 
 class FeedbackManager:
-    """Manages article feedback data"""
+    """Manages article feedback data
+    
+    Feedback events are appended to a JSONL log next to the snapshot file;
+    the log is replayed on startup and folded back into the snapshot once
+    it grows past COMPACT_RATIO times the snapshot size. The snapshot and the
+    log's first line carry a generation number, so a log that was already
+    folded into the snapshot (a crash before it was reset) is not replayed.
+    """
+    
+    COMPACT_RATIO = 10
+    COMPACT_MIN_BYTES = 64 * 1024
     
     def __init__(self, feedback_file: str = "article_feedback.json"):
         self.feedback_file = feedback_file
+        self.log_file = os.path.splitext(feedback_file)[0] + ".log"
+        self._log_generation = 0
         self.feedback_data = self._load_feedback()
+        self._rated_sources = set(self.feedback_data['source_scores'])
+        self._replay_log()
     
     def _load_feedback(self) -> dict:
         """Load feedback data from file"""
         if os.path.exists(self.feedback_file):
             try:
                 with open(self.feedback_file, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
+                self._log_generation = data.pop('log_generation', 0)
+                return data
             except Exception as e:
                 logger.error(f"Error loading feedback data: {e}")
         return {
             'articles': {},
             'user_preferences': {},
-            'source_scores': defaultdict(lambda: {'interesting': 0, 'not_relevant': 0})
+            'source_scores': {}
         }
     
-    def _save_feedback(self):
-        """Save feedback data to file"""
+    def _replay_log(self):
+        """Apply feedback events logged since the last snapshot"""
+        if not os.path.exists(self.log_file):
+            return
+        
+        replayed = 0
+        stale = False
         try:
-            # Convert defaultdict to regular dict for JSON serialization
-            data = self.feedback_data.copy()
-            data['source_scores'] = dict(data['source_scores'])
-            
-            with open(self.feedback_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(self.log_file, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from an interrupted write
+                        logger.warning(f"Skipping corrupt feedback log line in {self.log_file}")
+                        continue
+                    if 'log_generation' in event:
+                        if event['log_generation'] != self._log_generation:
+                            # Already folded into the snapshot before a crash
+                            logger.warning(f"Skipping feedback log {self.log_file} already in the snapshot")
+                            stale = True
+                            break
+                        continue
+                    self._apply_feedback(**event)
+                    replayed += 1
+        except Exception as e:
+            logger.error(f"Error replaying feedback log: {e}")
+        
+        if stale:
+            try:
+                self._reset_log()
+            except Exception as e:
+                logger.error(f"Error truncating feedback log: {e}")
+        
+        if replayed:
+            logger.info(f"Replayed {replayed} feedback events from {self.log_file}")
+    
+    def _save_feedback(self, log_generation: int) -> bool:
+        """Atomically replace the snapshot file; returns False if it could not be written"""
+        tmp_file = self.feedback_file + ".tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({**self.feedback_data, 'log_generation': log_generation},
+                          f, indent=2, default=str)
+            os.replace(tmp_file, self.feedback_file)
+            return True
         except Exception as e:
             logger.error(f"Error saving feedback data: {e}")
+            return False
+    
+    def _append_to_log(self, event: Dict):
+        """Append a single feedback event to the log"""
+        try:
+            with open(self.log_file, 'a') as f:
+                if f.tell() == 0:
+                    f.write(json.dumps({'log_generation': self._log_generation}) + "\n")
+                f.write(json.dumps(event, default=str) + "\n")
+        except Exception as e:
+            logger.error(f"Error writing feedback log: {e}")
+    
+    def _should_compact(self) -> bool:
+        """Check whether the log has outgrown the snapshot"""
+        try:
+            log_size = os.path.getsize(self.log_file)
+        except OSError:
+            return False
+        snapshot_size = os.path.getsize(self.feedback_file) if os.path.exists(self.feedback_file) else 0
+        return log_size > max(snapshot_size * self.COMPACT_RATIO, self.COMPACT_MIN_BYTES)
+    
+    def compact(self) -> bool:
+        """Fold the feedback log into the snapshot and start a new log"""
+        generation = self._log_generation + 1
+        if not self._save_feedback(generation):
+            # Keep the log; it still holds every event missing from the snapshot
+            return False
+        self._log_generation = generation
+        try:
+            self._reset_log()
+            logger.info(f"Compacted feedback log into {self.feedback_file}")
+        except Exception as e:
+            # The stale log is skipped on load since its generation is behind
+            logger.error(f"Error truncating feedback log: {e}")
+        return True
+    
+    def _reset_log(self):
+        """Replace the log with an empty one for the current generation"""
+        with open(self.log_file, 'w') as f:
+            f.write(json.dumps({'log_generation': self._log_generation}) + "\n")
     
     def add_feedback(self, article_id: str, user_id: str, 
                     feedback_type: str, article_metadata: Optional[Dict] = None):
         """Add feedback for an article"""
-        timestamp = datetime.now().isoformat()
+        event = {
+            'article_id': article_id,
+            'user_id': user_id,
+            'feedback_type': feedback_type,
+            'article_metadata': article_metadata,
+            'timestamp': datetime.now().isoformat()
+        }
+        self._apply_feedback(**event)
+        self._append_to_log(event)
         
+        if self._should_compact():
+            self.compact()
+        
+        logger.info(f"Added {feedback_type} feedback for article {article_id} from user {user_id}")
+    
+    def _apply_feedback(self, article_id: str, user_id: str, feedback_type: str,
+                        article_metadata: Optional[Dict], timestamp: str):
+        """Apply a feedback event to the in-memory data"""
         # Initialize article feedback if not exists
         if article_id not in self.feedback_data['articles']:
             self.feedback_data['articles'][article_id] = {
@@ -63,8 +173,8 @@ class FeedbackManager:
         # Update user preferences
         if user_id not in self.feedback_data['user_preferences']:
             self.feedback_data['user_preferences'][user_id] = {
-                'sources': defaultdict(lambda: {'interesting': 0, 'not_relevant': 0}),
-                'categories': defaultdict(lambda: {'interesting': 0, 'not_relevant': 0}),
+                'sources': {},
+                'categories': {},
                 'total_feedback': 0
             }
         
@@ -77,18 +187,18 @@ class FeedbackManager:
             category = article_metadata.get('category')
             
             if source:
+                user_prefs['sources'].setdefault(source, {'interesting': 0, 'not_relevant': 0})
                 user_prefs['sources'][source][feedback_type] += 1
                 
                 # Update global source scores
                 if source not in self.feedback_data['source_scores']:
                     self.feedback_data['source_scores'][source] = {'interesting': 0, 'not_relevant': 0}
                 self.feedback_data['source_scores'][source][feedback_type] += 1
+                self._rated_sources.add(source)
             
             if category:
+                user_prefs['categories'].setdefault(category, {'interesting': 0, 'not_relevant': 0})
                 user_prefs['categories'][category][feedback_type] += 1
-        
-        self._save_feedback()
-        logger.info(f"Added {feedback_type} feedback for article {article_id} from user {user_id}")
     
     def get_article_feedback_summary(self, article_id: str) -> Dict:
         """Get feedback summary for a specific article"""
@@ -136,10 +246,16 @@ class FeedbackManager:
         Calculate priority score for an article based on feedback data
         Returns a score between 0 and 1
         """
+        source = article_metadata.get('feed_name')
+        
+        # Unrated source and no user history always yields the base score
+        if source not in self._rated_sources and (
+                not user_id or user_id not in self.feedback_data['user_preferences']):
+            return 0.5
+        
         score = 0.5  # Base score
         
         # Adjust based on global source performance
-        source = article_metadata.get('feed_name')
         if source and source in self.feedback_data['source_scores']:
             scores = self.feedback_data['source_scores'][source]
             interesting = scores.get('interesting', 0)
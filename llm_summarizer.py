@@ -1,20 +1,235 @@
+import asyncio
 import logging
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from abc import ABC, abstractmethod
-import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, pipeline
+import importlib
 import os
+import re
+import functools
+import weakref
 import yaml
 from circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 
 logger = logging.getLogger(__name__)
 
+# Downloaded and converted model weights
+_CACHE_DIR = os.path.expanduser("~/.cache/slackwire/models")
+os.makedirs(_CACHE_DIR, exist_ok=True)
+
+
+@functools.cache
+def _optional_module(name: str):
+    """Import a model runtime on first use, or None if it is not installed.
+    
+    torch, transformers and ctranslate2 take seconds to import, and the
+    Ollama/llama.cpp backends never need them.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _require_module(name: str):
+    """Import a model runtime on first use, failing if it is not installed"""
+    module = _optional_module(name)
+    if module is None:
+        raise ImportError(f"{name} is required for this LLM backend")
+    return module
+
+
+@functools.lru_cache(maxsize=512)
+def _build_prompt(prompt_template: str, title: str, summary: str) -> str:
+    """Build the summarization prompt for an article (memoized on its fields)"""
+    content = f"Title: {title}\n"
+    if summary:
+        content += f"Description: {summary}\n"
+    
+    if prompt_template:
+        return f"{prompt_template}\n\n{content}\n\nSummary:"
+    
+    # Fallback to default prompt
+    return f"""Please provide a brief 2-3 sentence summary of this AI news article. Focus on the key findings, announcements, or developments. Be concise and informative.
+
+{content}
+
+Summary:"""
+
+
+def _quantized_load_kwargs(quantization: str, device: str) -> dict:
+    """Extra from_pretrained kwargs for the requested weight precision"""
+    if quantization not in ("none", "int8", "fp16", "bf16", "fp8"):
+        raise ValueError(f"Unknown quantization: {quantization}")
+    if quantization == "none":
+        return {}
+    if device != "cuda":
+        logger.warning("%s weights need CUDA; loading full precision on %s", quantization, device)
+        return {}
+    if quantization == "int8":
+        # bitsandbytes places the weights itself, so no explicit .to(device)
+        transformers = _require_module("transformers")
+        return {
+            "quantization_config": transformers.BitsAndBytesConfig(load_in_8bit=True),
+            "device_map": "auto"
+        }
+    torch = _require_module("torch")
+    if quantization == "fp16":
+        return {"torch_dtype": torch.float16}
+    # bf16, and the base dtype for fp8 weight-only quantization
+    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return {"torch_dtype": dtype}
+
+
+def _apply_fp8(model, quantization: str, device: str):
+    """Quantize weights to FP8 in place when requested and torchao is available"""
+    if quantization != "fp8" or device != "cuda":
+        return model
+    torchao_quantization = _optional_module("torchao.quantization")
+    if torchao_quantization is None:
+        logger.warning("fp8 requested but torchao is not installed; keeping 16-bit weights")
+        return model
+    torchao_quantization.quantize_(model, torchao_quantization.float8_weight_only())
+    return model
+
+
+def _create_http_session() -> requests.Session:
+    """HTTP session with keep-alive pooling and retries on gateway errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=4)
+def _load_pipeline(model_name: str, device: str, quantization: str):
+    """Load a summarization pipeline, shared by summarizers using the same model"""
+    logger.info("Initializing transformer model '%s' on %s", model_name, device)
+    try:
+        transformers = _require_module("transformers")
+        load_kwargs = _quantized_load_kwargs(quantization, device)
+        if load_kwargs:
+            # Build the pipeline around a pre-loaded reduced-precision model
+            model = transformers.AutoModelForSeq2SeqLM.from_pretrained(
+                model_name,
+                cache_dir=_CACHE_DIR,
+                **load_kwargs
+            )
+            model = _apply_fp8(model, quantization, device)
+            tokenizer = transformers.AutoTokenizer.from_pretrained(model_name, cache_dir=_CACHE_DIR)
+            pipeline_kwargs = {"model": model, "tokenizer": tokenizer}
+            if "device_map" not in load_kwargs:
+                pipeline_kwargs["device"] = 0
+        else:
+            pipeline_kwargs = {
+                "model": model_name,
+                "device": 0 if device == "cuda" else -1,
+                "cache_dir": _CACHE_DIR
+            }
+        
+        # Initialize the summarization pipeline
+        summarizer = transformers.pipeline("summarization", **pipeline_kwargs)
+        # Batched inputs are padded to a common length
+        if summarizer.tokenizer.pad_token is None:
+            summarizer.tokenizer.pad_token = summarizer.tokenizer.eos_token
+        logger.info("Model loaded successfully on %s", device)
+        return summarizer
+    except Exception as e:
+        logger.error("Failed to load model: %s", e)
+        raise
+
+
+@functools.lru_cache(maxsize=4)
+def _load_seq2seq_model(model_name: str, device: str, quantization: str,
+                        compile_model: bool, static_cache: bool):
+    """Load a seq2seq model, shared by summarizers with the same settings"""
+    logger.info("Initializing seq2seq model '%s' on %s", model_name, device)
+    try:
+        transformers = _require_module("transformers")
+        load_kwargs = _quantized_load_kwargs(quantization, device)
+        model = transformers.AutoModelForSeq2SeqLM.from_pretrained(
+            model_name,
+            cache_dir=_CACHE_DIR,
+            **load_kwargs
+        )
+        if "device_map" not in load_kwargs:
+            model.to(device)
+        model = _apply_fp8(model, quantization, device)
+        model.eval()
+        if static_cache:
+            # Preallocated KV cache: no per-step growth, and fixed shapes for CUDA graphs
+            model.generation_config.cache_implementation = "static"
+        if compile_model and device == "cuda":
+            model.forward = _require_module("torch").compile(model.forward, mode="reduce-overhead", fullgraph=False)
+            logger.info("Compiled seq2seq forward pass with torch.compile")
+        logger.info("Seq2seq model loaded successfully on %s", device)
+        return model
+    except Exception as e:
+        logger.error("Failed to load seq2seq model: %s", e)
+        raise
+
+
+@functools.lru_cache(maxsize=8)
+def _load_tokenizer(model_name: str):
+    """Load a tokenizer, shared by summarizers using the same model"""
+    return _require_module("transformers").AutoTokenizer.from_pretrained(model_name, cache_dir=_CACHE_DIR)
+
+
+def _text_length(article: Dict) -> int:
+    """Approximate prompt size of an article, used to group batches"""
+    return len(article.get('title') or '') + len(article.get('summary') or '')
+
+
+_WORD_RE = re.compile(r"\w+")
+# Jaccard similarity of title words above which two articles are one story
+_DUPLICATE_TITLE_SIMILARITY = 0.85
+
+
+def _coalesce_duplicates(articles: List[Dict]) -> Tuple[List[int], List[int]]:
+    """Group near-identical titles; returns representative indices and each article's group"""
+    representatives: List[int] = []
+    representative_words: List[frozenset] = []
+    groups: List[int] = []
+    for i, article in enumerate(articles):
+        words = frozenset(_WORD_RE.findall((article.get('title') or '').lower()))
+        for group, other in enumerate(representative_words):
+            if words and len(words & other) >= _DUPLICATE_TITLE_SIMILARITY * len(words | other):
+                groups.append(group)
+                break
+        else:
+            groups.append(len(representatives))
+            representatives.append(i)
+            representative_words.append(words)
+    return representatives, groups
+
+
+def _sentence_end(text: str, count: int) -> Optional[int]:
+    """Index just past the `count`-th sentence terminator followed by a space, if any"""
+    end = -1
+    for _ in range(count):
+        end = text.find('. ', end + 1)
+        if end == -1:
+            return None
+    return end + 1
+
 
 class LLMSummarizer(ABC):
     """Abstract base class for LLM summarizers"""
     
+    # Backends that implement _generate_batch run a whole batch per model call
+    supports_batching = False
+    # Articles per model call; batches are grouped by prompt length
+    batch_size = 8
+    
     def __init__(self):
         # Load config for prompts and circuit breaker settings
         self.config = self._load_config()
@@ -35,7 +250,7 @@ class LLMSummarizer(ABC):
             with open('config.yaml', 'r') as f:
                 return yaml.safe_load(f)
         except Exception as e:
-            logger.error(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
             return {}
     
     def get_prompt_for_category(self, category: str) -> str:
@@ -43,6 +258,15 @@ class LLMSummarizer(ABC):
         prompts = self.config.get('llm_prompts', {})
         return prompts.get(category, prompts.get('default', ''))
     
+    def _create_prompt(self, article: Dict) -> str:
+        """Create prompt for summarization"""
+        category = article.get('category', 'default')
+        return _build_prompt(
+            self.get_prompt_for_category(category),
+            article['title'],
+            article.get('summary') or ''
+        )
+    
     @abstractmethod
     def _generate_summary(self, article: Dict) -> Optional[str]:
         """Internal method to generate summary (implemented by subclasses)"""
@@ -53,306 +277,592 @@ class LLMSummarizer(ABC):
         try:
             return self.circuit_breaker.call(self._generate_summary, article)
         except Exception as e:
-            logger.warning(f"Circuit breaker prevented summarization: {e}")
+            logger.warning("Circuit breaker prevented summarization: %s", e)
             return None
+    
+    def summarize_batch(self, articles: List[Dict]) -> List[Optional[str]]:
+        """Generate summaries for several articles with circuit breaker protection"""
+        if not self.supports_batching:
+            return [self.summarize(article) for article in articles]
+        
+        # Similar-length articles share a batch so little of it is padding
+        order = sorted(range(len(articles)), key=lambda i: _text_length(articles[i]))
+        summaries: List[Optional[str]] = [None] * len(articles)
+        for start in range(0, len(order), self.batch_size):
+            indices = order[start:start + self.batch_size]
+            try:
+                batch = self.circuit_breaker.call(
+                    self._generate_batch, [articles[i] for i in indices]
+                )
+            except Exception as e:
+                logger.warning("Circuit breaker prevented summarization: %s", e)
+                continue
+            for i, summary in zip(indices, batch):
+                summaries[i] = summary
+        return summaries
+    
+    def _generate_batch(self, articles: List[Dict]) -> List[Optional[str]]:
+        """Generate summaries in one model call (for backends with supports_batching)"""
+        raise NotImplementedError
+    
+    def warmup(self):
+        """Load the model ahead of the first summary request"""
+        pass
+    
+    async def aclose(self):
+        """Release resources held for async summarization"""
+        pass
+    
+    async def asummarize_many(self, articles: List[Dict], concurrency: int = 8) -> List[Optional[str]]:
+        """Summarize articles without blocking the event loop, once per duplicate story"""
+        representatives, groups = _coalesce_duplicates(articles)
+        if len(representatives) < len(articles):
+            logger.info(
+                "Coalesced %d duplicate articles before summarization",
+                len(articles) - len(representatives)
+            )
+        summaries = await self._asummarize_unique(
+            [articles[i] for i in representatives], concurrency
+        )
+        return [summaries[group] for group in groups]
+    
+    async def _asummarize_unique(self, articles: List[Dict], concurrency: int) -> List[Optional[str]]:
+        """Summarize distinct articles"""
+        # Local models batch internally, so one worker thread runs the whole list
+        return await asyncio.to_thread(self.summarize_batch, articles)
 
 
-class OllamaSummarizer(LLMSummarizer):
-    """Summarizer using Ollama local LLM"""
+class HTTPSummarizer(LLMSummarizer):
+    """Base class for summarizers that call a local LLM server over HTTP"""
     
-    def __init__(self, base_url: str = "http://localhost:11434", 
-                 model: str = "llama3.2", 
-                 max_tokens: int = 150):
+    api_name = "LLM"
+    endpoint = ""
+    
+    def __init__(self, base_url: str):
         super().__init__()
         self.base_url = base_url
-        self.model = model
-        self.max_tokens = max_tokens
-        
+        self.session = _create_http_session()
+        self._asession: Optional[aiohttp.ClientSession] = None
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self.session.close()
+    
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Return the shared async session so connections persist across feed checks"""
+        if self._asession is None or self._asession.closed:
+            self._asession = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._asession
+    
+    async def aclose(self):
+        """Close the shared async session"""
+        if self._asession and not self._asession.closed:
+            await self._asession.close()
+    
+    def __del__(self):
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+    
+    @abstractmethod
+    def _build_payload(self, prompt: str) -> Dict:
+        """Build the request body for a prompt"""
+        pass
+    
+    @abstractmethod
+    def _extract_summary(self, result: Dict) -> str:
+        """Pull the generated text out of the response body"""
+        pass
+    
     def _generate_summary(self, article: Dict) -> Optional[str]:
-        """Generate summary using Ollama"""
-        # Prepare the prompt
+        """Generate summary with a blocking request to the server"""
         prompt = self._create_prompt(article)
         
-        # Call Ollama API
-        response = requests.post(
-            f"{self.base_url}/api/generate",
-            json={
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "num_predict": self.max_tokens,
-                    "temperature": 0.3,
-                    "top_p": 0.9
-                }
-            },
+        response = self.session.post(
+            f"{self.base_url}{self.endpoint}",
+            json=self._build_payload(prompt),
             timeout=30
         )
         
         if response.status_code == 200:
-            result = response.json()
-            summary = result.get("response", "").strip()
-            logger.info(f"Generated summary for: {article['title'][:50]}...")
+            summary = self._extract_summary(response.json()).strip()
+            logger.info("Generated summary for: %s...", article['title'][:50])
             return summary
         else:
-            logger.error(f"Ollama API error: {response.status_code} - {response.text}")
-            raise Exception(f"Ollama API error: {response.status_code}")
+            logger.error("%s API error: %s - %s", self.api_name, response.status_code, response.text)
+            raise Exception(f"{self.api_name} API error: {response.status_code}")
     
-    def _create_prompt(self, article: Dict) -> str:
-        """Create prompt for summarization"""
-        category = article.get('category', 'default')
-        prompt_template = self.get_prompt_for_category(category)
+    async def _asummarize_unique(self, articles: List[Dict], concurrency: int) -> List[Optional[str]]:
+        """Summarize articles with up to `concurrency` requests in flight"""
+        semaphore = asyncio.Semaphore(concurrency)
+        session = self._get_async_session()
         
-        content = f"Title: {article['title']}\n"
-        if article.get('summary'):
-            content += f"Description: {article['summary']}\n"
+        async def summarize_one(article: Dict) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await self.circuit_breaker.call_async(
+                        self._agenerate_summary, session, article
+                    )
+                except Exception as e:
+                    logger.warning("Circuit breaker prevented summarization: %s", e)
+                    return None
         
-        if prompt_template:
-            prompt = f"{prompt_template}\n\n{content}\n\nSummary:"
-        else:
-            # Fallback to default prompt
-            prompt = f"""Please provide a brief 2-3 sentence summary of this AI news article. Focus on the key findings, announcements, or developments. Be concise and informative.
-
-{content}
-
-Summary:"""
-        return prompt
+        return await asyncio.gather(*(summarize_one(article) for article in articles))
+    
+    async def _agenerate_summary(self, session: aiohttp.ClientSession, article: Dict) -> Optional[str]:
+        """Generate summary with a non-blocking request to the server"""
+        prompt = self._create_prompt(article)
+        
+        async with session.post(
+            f"{self.base_url}{self.endpoint}",
+            json=self._build_payload(prompt)
+        ) as response:
+            if response.status == 200:
+                summary = self._extract_summary(await response.json()).strip()
+                logger.info("Generated summary for: %s...", article['title'][:50])
+                return summary
+            text = await response.text()
+            logger.error("%s API error: %s - %s", self.api_name, response.status, text)
+            raise Exception(f"{self.api_name} API error: {response.status}")
 
 
-class LlamaCppSummarizer(LLMSummarizer):
-    """Summarizer using llama.cpp server"""
+class OllamaSummarizer(HTTPSummarizer):
+    """Summarizer using Ollama local LLM"""
     
-    def __init__(self, base_url: str = "http://localhost:8080", 
-                 max_tokens: int = 150):
-        super().__init__()
-        self.base_url = base_url
+    api_name = "Ollama"
+    endpoint = "/api/generate"
+    # Summaries are asked to be 2-3 sentences
+    max_sentences = 3
+    
+    def __init__(self, base_url: str = "http://localhost:11434", 
+                 model: str = "llama3.2:3b-instruct-q4_K_M", 
+                 max_tokens: int = 150,
+                 keep_alive: Optional[str] = None):
+        super().__init__(base_url)
+        self.model = model
         self.max_tokens = max_tokens
-        
-    def _generate_summary(self, article: Dict) -> Optional[str]:
-        """Generate summary using llama.cpp server"""
-        prompt = self._create_prompt(article)
-        
-        response = requests.post(
-            f"{self.base_url}/completion",
-            json={
-                "prompt": prompt,
-                "n_predict": self.max_tokens,
-                "temperature": 0.3,
-                "top_p": 0.9,
-                "stop": ["\n\n", "Title:", "Description:"]
-            },
-            timeout=30
+        # How long Ollama keeps the model loaded after a request; -1 keeps it resident
+        keep_alive = keep_alive or os.getenv("OLLAMA_KEEP_ALIVE", "-1")
+        # Ollama reads bare numbers as seconds but strings as durations ("10m")
+        self.keep_alive = int(keep_alive) if keep_alive.lstrip("-").isdigit() else keep_alive
+        # Request fields that are the same for every article
+        self._options = {
+            "num_predict": self.max_tokens,
+            "temperature": 0.3,
+            "top_p": 0.9,
+            "stop": ["\n\n", "Title:"]
+        }
+    
+    def _build_payload(self, prompt: str) -> Dict:
+        """Build an Ollama generate request"""
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": self.keep_alive,
+            "options": self._options
+        }
+    
+    def warmup(self):
+        """Ask Ollama to load the model; a request without a prompt only loads it"""
+        response = self.session.post(
+            f"{self.base_url}{self.endpoint}",
+            json={"model": self.model, "keep_alive": self.keep_alive},
+            timeout=300
         )
-        
-        if response.status_code == 200:
-            result = response.json()
-            summary = result.get("content", "").strip()
-            logger.info(f"Generated summary for: {article['title'][:50]}...")
-            return summary
-        else:
-            logger.error(f"llama.cpp API error: {response.status_code}")
-            raise Exception(f"llama.cpp API error: {response.status_code}")
+        response.raise_for_status()
+        logger.info("Ollama model %s loaded", self.model)
     
-    def _create_prompt(self, article: Dict) -> str:
-        """Create prompt for summarization"""
-        category = article.get('category', 'default')
-        prompt_template = self.get_prompt_for_category(category)
+    def _extract_summary(self, result: Dict) -> str:
+        """Read the Ollama response text"""
+        return result.get("response", "")
+    
+    def _generate_summary(self, article: Dict) -> Optional[str]:
+        """Stream the Ollama response and stop once the summary is complete"""
+        prompt = self._create_prompt(article)
         
-        content = f"Title: {article['title']}\n"
-        if article.get('summary'):
-            content += f"Description: {article['summary']}\n"
+        try:
+            with self.session.post(
+                f"{self.base_url}{self.endpoint}",
+                json={**self._build_payload(prompt), "stream": True},
+                stream=True,
+                timeout=30
+            ) as response:
+                if response.status_code != 200:
+                    logger.error("%s API error: %s - %s", self.api_name, response.status_code, response.text)
+                    raise Exception(f"{self.api_name} API error: {response.status_code}")
+                
+                summary = ""
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    summary += chunk.get("response", "")
+                    if chunk.get("done"):
+                        break
+                    # Closing the stream early stops generation on the server
+                    end = _sentence_end(summary, self.max_sentences)
+                    if end is not None:
+                        summary = summary[:end]
+                        break
+        except (requests.exceptions.ChunkedEncodingError, ValueError) as e:
+            logger.warning("Ollama stream failed (%s); retrying without streaming", e)
+            return super()._generate_summary(article)
         
-        if prompt_template:
-            prompt = f"{prompt_template}\n\n{content}\n\nSummary:"
-        else:
-            # Fallback to default prompt
-            prompt = f"""Please provide a brief 2-3 sentence summary of this AI news article. Focus on the key findings, announcements, or developments. Be concise and informative.
+        summary = summary.strip()
+        logger.info("Generated summary for: %s...", article['title'][:50])
+        return summary
 
-{content}
 
-Summary:"""
-        return prompt
+class LlamaCppSummarizer(HTTPSummarizer):
+    """Summarizer using llama.cpp server"""
+    
+    api_name = "llama.cpp"
+    endpoint = "/completion"
+    
+    def __init__(self, base_url: str = "http://localhost:8080", 
+                 max_tokens: int = 150):
+        super().__init__(base_url)
+        self.max_tokens = max_tokens
+    
+    def _build_payload(self, prompt: str) -> Dict:
+        """Build a llama.cpp completion request"""
+        return {
+            "prompt": prompt,
+            "n_predict": self.max_tokens,
+            "temperature": 0.3,
+            "top_p": 0.9,
+            "stop": ["\n\n", "Title:", "Description:"]
+        }
+    
+    def _extract_summary(self, result: Dict) -> str:
+        """Read the llama.cpp completion text"""
+        return result.get("content", "")
 
 
 class TransformerSummarizer(LLMSummarizer):
     """Built-in summarizer using Hugging Face transformers"""
     
+    supports_batching = True
+    text_template = "Title: %s\nArticle: %s"
+    
     def __init__(self, model_name: str = "facebook/bart-large-cnn", 
                  max_length: int = 150, 
                  min_length: int = 50,
-                 device: str = None):
+                 device: str = None,
+                 batch_size: int = 8,
+                 quantization: str = "none"):
         super().__init__()
         self.model_name = model_name
         self.max_length = max_length
         self.min_length = min_length
+        self.batch_size = batch_size
+        self.quantization = quantization
         
         # Determine device
         if device is None:
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.device = "cuda" if _require_module("torch").cuda.is_available() else "cpu"
         else:
             self.device = device
             
-        logger.info(f"Initializing transformer model '{model_name}' on {self.device}")
-        
-        # Create cache directory
-        self.cache_dir = os.path.expanduser("~/.cache/slackwire/models")
-        os.makedirs(self.cache_dir, exist_ok=True)
-        
-        try:
-            # Initialize the summarization pipeline
-            self.summarizer = pipeline(
-                "summarization",
-                model=model_name,
-                device=0 if self.device == "cuda" else -1,
-                cache_dir=self.cache_dir
-            )
-            logger.info(f"Model loaded successfully on {self.device}")
-        except Exception as e:
-            logger.error(f"Failed to load model: {e}")
-            raise
+        self.cache_dir = _CACHE_DIR
+    
+    @functools.cached_property
+    def summarizer(self):
+        """Summarization pipeline, loaded on first use"""
+        return _load_pipeline(self.model_name, self.device, self.quantization)
+    
+    def warmup(self):
+        """Load the summarization pipeline"""
+        self.summarizer
     
     def _generate_summary(self, article: Dict) -> Optional[str]:
         """Generate summary using transformer model"""
-        # Prepare the text
-        text = self._prepare_text(article)
+        summary = self._generate_batch([article])[0]
+        if summary is None:
+            raise Exception("No summary generated")
+        return summary
+    
+    def _generate_batch(self, articles: List[Dict]) -> List[Optional[str]]:
+        """Run the pipeline once over all articles"""
+        if not articles:
+            return []
         
-        # Generate summary
-        result = self.summarizer(
-            text,
+        # Prepare the texts
+        texts = [self._prepare_text(article) for article in articles]
+        
+        summaries = []
+        for article, summary in zip(articles, self._summarize_texts(texts)):
+            summary = summary.strip()
+            if not summary:
+                summaries.append(None)
+                continue
+            # Add context about what the article is about
+            summaries.append(
+                f"{summary} The article is from {article.get('feed_name', 'an AI news source')}."
+            )
+            logger.info("Generated summary for: %s...", article['title'][:50])
+        return summaries
+    
+    def _summarize_texts(self, texts: List[str]) -> List[str]:
+        """Run the summarization model over prepared texts"""
+        # The pipeline pads and stacks each batch
+        results = self.summarizer(
+            texts,
             max_length=self.max_length,
             min_length=self.min_length,
             do_sample=False,
-            truncation=True
+            truncation=True,
+            batch_size=min(self.batch_size, len(texts))
         )
-        
-        if result and len(result) > 0:
-            summary = result[0]['summary_text']
-            # Clean up the summary
-            summary = summary.strip()
-            # Add context about what the article is about
-            summary = f"{summary} The article is from {article.get('feed_name', 'an AI news source')}."
-            logger.info(f"Generated summary for: {article['title'][:50]}...")
-            return summary
-        else:
-            raise Exception("No summary generated")
+        return [result.get('summary_text', '') if result else '' for result in results]
     
     def _prepare_text(self, article: Dict) -> str:
         """Prepare article text for summarization"""
         # Combine title and description/summary
-        parts = []
-        
-        # Add title
-        if article.get('title'):
-            parts.append(f"Title: {article['title']}")
-            
-        # Add existing summary/description
-        if article.get('summary'):
-            parts.append(f"Article: {article['summary']}")
-            
-        # Join with newlines
-        text = "\n".join(parts)
+        title = article.get('title')
+        summary = article.get('summary')
+        if title and summary:
+            text = self.text_template % (title, summary)
+        elif title:
+            text = "Title: %s" % title
+        elif summary:
+            text = "Article: %s" % summary
+        else:
+            text = ""
         
-        # Ensure text isn't too long (BART has a 1024 token limit)
-        if len(text) > 1024:
-            text = text[:1024]
-            
+        # No character cut here: the tokenizer truncates to the model's
+        # 1024-token limit, which fits far more than 1024 characters
         return text
 
 
+class CTranslate2Summarizer(TransformerSummarizer):
+    """Summarizer running a CTranslate2 conversion of a seq2seq model"""
+    
+    def __init__(self, model_name: str = "facebook/bart-large-cnn", 
+                 max_length: int = 150, 
+                 min_length: int = 50,
+                 device: str = None,
+                 batch_size: int = 8,
+                 compute_type: str = "int8",
+                 beam_size: int = 4):
+        ctranslate2 = _require_module("ctranslate2")
+        if device is None:
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        super().__init__(model_name, max_length, min_length, device, batch_size)
+        self.compute_type = compute_type
+        self.beam_size = beam_size
+        self.model_dir = os.path.join(self.cache_dir, model_name.replace('/', '--') + "-ct2")
+    
+    @functools.cached_property
+    def tokenizer(self):
+        """Hugging Face tokenizer for the source model"""
+        return _load_tokenizer(self.model_name)
+    
+    @functools.cached_property
+    def translator(self):
+        """CTranslate2 translator, converting the model once on first use"""
+        try:
+            if not os.path.exists(os.path.join(self.model_dir, "model.bin")):
+                logger.info("Converting '%s' to CTranslate2 (%s)", self.model_name, self.compute_type)
+                ctranslate2 = _require_module("ctranslate2")
+                converter = ctranslate2.converters.TransformersConverter(self.model_name)
+                converter.convert(self.model_dir, quantization=self.compute_type, force=True)
+            translator = _require_module("ctranslate2").Translator(
+                self.model_dir,
+                device=self.device,
+                compute_type=self.compute_type
+            )
+            logger.info("CTranslate2 model loaded successfully on %s", self.device)
+            return translator
+        except Exception as e:
+            logger.error("Failed to load CTranslate2 model: %s", e)
+            raise
+    
+    def warmup(self):
+        """Load the tokenizer and translator"""
+        self.tokenizer
+        self.translator
+    
+    def _summarize_texts(self, texts: List[str]) -> List[str]:
+        """Run CTranslate2 beam search over prepared texts"""
+        sources = [
+            self.tokenizer.convert_ids_to_tokens(
+                self.tokenizer.encode(text, truncation=True, max_length=1024)
+            )
+            for text in texts
+        ]
+        results = self.translator.translate_batch(
+            sources,
+            beam_size=self.beam_size,
+            max_decoding_length=self.max_length,
+            min_decoding_length=self.min_length,
+            max_batch_size=self.batch_size
+        )
+        return [
+            self.tokenizer.decode(
+                self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+                skip_special_tokens=True
+            )
+            for result in results
+        ]
+
+
 class FlantT5Summarizer(LLMSummarizer):
     """Summarizer using Google's Flan-T5 model"""
     
+    supports_batching = True
+    
+    # Prompt pieces: a fixed instruction followed by the per-article text
+    arxiv_instruction = (
+        "Based on this research paper abstract, provide a 2-3 sentence summary "
+        "highlighting the key contributions and findings:\n\n"
+    )
+    news_instruction = "Summarize this AI news article in 2-3 sentences:\n\n"
+    abstract_template = "Title: %s\nAbstract: %s\n\nSummary:"
+    content_template = "Title: %s\nContent: %s\n\nSummary:"
+    
     def __init__(self, model_name: str = "google/flan-t5-base", 
                  max_length: int = 150,
-                 device: str = None):
+                 device: str = None,
+                 quantization: str = "none",
+                 use_speculative: bool = False,
+                 draft_model_name: str = "google/flan-t5-small",
+                 compile_model: bool = False,
+                 static_cache: bool = False):
         super().__init__()
         self.model_name = model_name
         self.max_length = max_length
+        self.quantization = quantization
+        self.use_speculative = use_speculative
+        self.draft_model_name = draft_model_name
+        self._prefix_cache: Dict[str, List[int]] = {}
+        self.compile_model = compile_model
         
         # Determine device
         if device is None:
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.device = "cuda" if _require_module("torch").cuda.is_available() else "cpu"
         else:
             self.device = device
-            
-        logger.info(f"Initializing Flan-T5 model '{model_name}' on {self.device}")
-        
-        # Create cache directory
-        self.cache_dir = os.path.expanduser("~/.cache/slackwire/models")
-        os.makedirs(self.cache_dir, exist_ok=True)
         
-        try:
-            # Load tokenizer and model
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                model_name, 
-                cache_dir=self.cache_dir
-            )
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(
-                model_name,
-                cache_dir=self.cache_dir
-            )
-            self.model.to(self.device)
-            self.model.eval()
-            logger.info(f"Flan-T5 model loaded successfully on {self.device}")
-        except Exception as e:
-            logger.error(f"Failed to load Flan-T5 model: {e}")
-            raise
+        # CUDA graph capture for the compiled model needs the static cache too
+        self.static_cache = static_cache or (compile_model and self.device == "cuda")
+            
+        self.cache_dir = _CACHE_DIR
+    
+    @functools.cached_property
+    def tokenizer(self):
+        """Flan-T5 tokenizer, loaded on first use"""
+        return _load_tokenizer(self.model_name)
+    
+    @functools.cached_property
+    def model(self):
+        """Flan-T5 model, loaded on first use"""
+        return _load_seq2seq_model(
+            self.model_name, self.device, self.quantization,
+            self.compile_model, self.static_cache
+        )
+    
+    def warmup(self):
+        """Load the tokenizer and model (and draft model when speculating)"""
+        self.tokenizer
+        self.model
+        if self.use_speculative:
+            self.draft_model
+    
+    @functools.cached_property
+    def draft_model(self):
+        """Small Flan-T5 used to propose tokens for assisted generation"""
+        logger.info("Initializing draft model '%s' on %s", self.draft_model_name, self.device)
+        model = _require_module("transformers").AutoModelForSeq2SeqLM.from_pretrained(
+            self.draft_model_name,
+            cache_dir=self.cache_dir,
+            torch_dtype=self.model.dtype
+        )
+        model.to(self.device)
+        model.eval()
+        return model
+    
+    def _generation_kwargs(self) -> Dict:
+        """Decoding settings for generate()"""
+        if self.use_speculative:
+            # Assisted generation only supports greedy/sampling, not beams
+            return {
+                'assistant_model': self.draft_model,
+                'num_beams': 1
+            }
+        return {
+            'num_beams': 4,
+            'early_stopping': True
+        }
     
     def _generate_summary(self, article: Dict) -> Optional[str]:
         """Generate summary using Flan-T5"""
-        # Create prompt
-        prompt = self._create_prompt(article)
+        return self._generate_batch([article])[0]
+    
+    def _generate_batch(self, articles: List[Dict]) -> List[Optional[str]]:
+        """Tokenize and generate for all articles in one padded batch"""
+        if not articles:
+            return []
         
-        # Tokenize input
-        inputs = self.tokenizer(
-            prompt, 
-            return_tensors="pt", 
-            max_length=512, 
-            truncation=True
-        ).to(self.device)
+        # Tokenize input; the instruction prefix ids are cached per template
+        encoded = {'input_ids': [self._encode_prompt(article) for article in articles]}
+        if self.static_cache:
+            # Pad to a fixed bucket so every call fits one preallocated cache shape
+            pad_kwargs = {'padding': 'max_length', 'max_length': 512}
+        else:
+            pad_kwargs = {'padding': True}
+        inputs = self.tokenizer.pad(encoded, return_tensors="pt", **pad_kwargs).to(
+            self.device, non_blocking=True
+        )
         
-        # Generate summary
-        with torch.no_grad():
+        # Generate summaries
+        with _require_module("torch").no_grad():
             outputs = self.model.generate(
                 **inputs,
                 max_length=self.max_length,
                 min_length=30,
                 temperature=0.7,
                 do_sample=False,
-                num_beams=4,
-                early_stopping=True
+                use_cache=True,
+                # Block repeated trigrams at generation time
+                no_repeat_ngram_size=3,
+                **self._generation_kwargs()
             )
         
-        # Decode the output
-        summary = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+        # Decode the outputs
+        decoded = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
         
-        if summary:
-            # Check for repetitive patterns (common with insufficient context)
-            words = summary.split()
-            if len(words) > 10:
-                # Check if the same phrase is repeated more than 3 times
-                for i in range(len(words) - 3):
-                    phrase = ' '.join(words[i:i+3])
-                    if summary.count(phrase) > 3:
-                        logger.warning(f"Detected repetitive summary for: {article['title'][:50]}...")
-                        # Fallback to a simple extraction
-                        title = article.get('title', '')
-                        content = article.get('summary', '')
-                        feed_name = article.get('feed_name', '')
-                        if 'ArXiv' in feed_name:
-                            first_sentence = content.split('.')[0] if content else ''
-                            return f"New research paper on {title.lower()}. {first_sentence}."
-                        else:
-                            first_sentence = content.split('.')[0] if content else ''
-                            return f"Article about {title.lower()}. {first_sentence}."
-            
-            logger.info(f"Generated summary for: {article['title'][:50]}...")
-            return summary.strip()
-        else:
-            raise Exception("No summary generated")
+        summaries = []
+        for article, summary in zip(articles, decoded):
+            summary = summary.strip()
+            if summary:
+                logger.info("Generated summary for: %s...", article['title'][:50])
+                summaries.append(summary)
+            else:
+                summaries.append(self._fallback_summary(article))
+        return summaries
+    
+    def _fallback_summary(self, article: Dict) -> str:
+        """Simple extraction used when the model produced nothing"""
+        logger.warning("Empty summary generated for: %s...", article['title'][:50])
+        title = article.get('title', '')
+        content = article.get('summary', '')
+        feed_name = article.get('feed_name', '')
+        first_sentence = content.split('.')[0] if content else ''
+        if 'ArXiv' in feed_name:
+            return f"New research paper on {title.lower()}. {first_sentence}."
+        return f"Article about {title.lower()}. {first_sentence}."
     
     def _create_prompt(self, article: Dict) -> str:
         """Create prompt for Flan-T5 summarization"""
+        return "".join(self._split_prompt(article))
+    
+    def _split_prompt(self, article: Dict) -> Tuple[str, str]:
+        """Split the prompt into its fixed instruction and per-article text"""
         title = article.get('title', '')
         content = article.get('summary', '')
         category = article.get('category', 'default')
@@ -362,36 +872,63 @@ class FlantT5Summarizer(LLMSummarizer):
         
         if prompt_template:
             # Use category-specific prompt
-            prompt = f"{prompt_template}\n\nTitle: {title}\nContent: {content}\n\nSummary:"
-        else:
-            # Fallback to original logic
-            feed_name = article.get('feed_name', '')
-            if 'ArXiv' in feed_name and content:
-                prompt = f"""Based on this research paper abstract, provide a 2-3 sentence summary highlighting the key contributions and findings:
-
-Title: {title}
-Abstract: {content}
-
-Summary:"""
-            else:
-                prompt = f"""Summarize this AI news article in 2-3 sentences:
+            return prompt_template + "\n\n", self.content_template % (title, content)
+        
+        # Fallback to original logic
+        feed_name = article.get('feed_name', '')
+        if 'ArXiv' in feed_name and content:
+            return self.arxiv_instruction, self.abstract_template % (title, content)
+        return self.news_instruction, self.content_template % (title, content)
+    
+    def _prefix_ids(self, prefix: str) -> List[int]:
+        """Token ids for a fixed instruction, tokenized once per template"""
+        ids = self._prefix_cache.get(prefix)
+        if ids is None:
+            ids = self.tokenizer(prefix, add_special_tokens=False)['input_ids']
+            self._prefix_cache[prefix] = ids
+        return ids
+    
+    def _encode_prompt(self, article: Dict) -> List[int]:
+        """Token ids for the full prompt, re-tokenizing only the article text"""
+        prefix, variable = self._split_prompt(article)
+        prefix_ids = self._prefix_ids(prefix)
+        variable_ids = self.tokenizer(
+            variable,
+            max_length=max(512 - len(prefix_ids), 1),
+            truncation=True
+        )['input_ids']
+        return prefix_ids + variable_ids
 
-Title: {title}
-Content: {content}
 
-Summary:"""
-        return prompt
+# Summarizers already built by create_summarizer, keyed on (backend, kwargs).
+# Weak references let an unused backend (and its model weights) be collected.
+_instance_cache: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
 
 
 def create_summarizer(backend: str = "transformer", **kwargs) -> LLMSummarizer:
     """Factory function to create appropriate summarizer"""
+    # Without torch, the CTranslate2 runtime is the only way to run BART
+    if (backend == "transformer" and _optional_module("torch") is None
+            and _optional_module("ctranslate2") is not None):
+        backend = "ct2"
+    
+    cache_key = (backend, frozenset(kwargs.items()))
+    summarizer = _instance_cache.get(cache_key)
+    if summarizer is not None:
+        return summarizer
+    
     if backend == "transformer":
-        return TransformerSummarizer(**kwargs)
+        summarizer = TransformerSummarizer(**kwargs)
+    elif backend == "ct2":
+        summarizer = CTranslate2Summarizer(**kwargs)
     elif backend == "flan-t5":
-        return FlantT5Summarizer(**kwargs)
+        summarizer = FlantT5Summarizer(**kwargs)
     elif backend == "ollama":
-        return OllamaSummarizer(**kwargs)
+        summarizer = OllamaSummarizer(**kwargs)
     elif backend == "llamacpp":
-        return LlamaCppSummarizer(**kwargs)
+        summarizer = LlamaCppSummarizer(**kwargs)
     else:
-        raise ValueError(f"Unknown LLM backend: {backend}")
\ No newline at end of file
+        raise ValueError(f"Unknown LLM backend: {backend}")
+    
+    _instance_cache[cache_key] = summarizer
+    return summarizer
@@ -1,9 +1,46 @@
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
 import json
 import os
+import queue
 import sys
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Background thread that formats and writes records queued by setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Standard LogRecord attributes; anything else on a record came in via `extra`
+_STD_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'pathname', 'process', 'processName', 'relativeCreated',
+    'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info',
+    'message', 'asctime'
+})
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes the way orjson does with OPT_UTC_Z"""
+    if isinstance(value, datetime):
+        return value.isoformat().replace('+00:00', 'Z')
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Encode a log record dict, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_UTC_Z).decode()
+    return json.dumps(data, default=_json_default)
 
 
 class JSONFormatter(logging.Formatter):
@@ -12,7 +49,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -23,33 +60,51 @@ class JSONFormatter(logging.Formatter):
         
         # Add exception info if present
         if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
+            log_data['exception'] = record.exc_text or self.formatException(record.exc_info)
         
         # Add extra fields
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename', 'funcName',
-                          'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                          'pathname', 'process', 'processName', 'relativeCreated',
-                          'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info']:
-                log_data[key] = value
+        log_data.update({
+            key: value for key, value in record.__dict__.items()
+            if key not in _STD_LOGRECORD_ATTRS
+        })
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+class _ExcInfoQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves exception formatting to the listener's formatters"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message but keep exc_info for the formatter"""
+        # The base class formats the whole record into msg and drops exc_info,
+        # which loses the separate exception field in JSON logs
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            # Render now, while the traceback still matches the logging call
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+        return record
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
 
 
 class ContextFilter(logging.Filter):
     """Add contextual information to log records"""
     
+    def __init__(self, name: str = ''):
+        super().__init__(name)
+        # Deployment environment, service name and version are fixed for the process
+        self._env = os.getenv('ENVIRONMENT', 'development')
+        self._service = 'slackwire'
+        self._version = os.getenv('APP_VERSION', '1.0.0')
+    
     def filter(self, record: logging.LogRecord) -> bool:
         """Add context fields to record"""
-        # Add deployment environment
-        record.environment = os.getenv('ENVIRONMENT', 'development')
-        
-        # Add service name
-        record.service = 'slackwire'
-        
-        # Add version (could be from git or package)
-        record.version = os.getenv('APP_VERSION', '1.0.0')
-        
+        record.environment = self._env
+        record.service = self._service
+        record.version = self._version
         return True
 
 
@@ -68,6 +123,10 @@ def setup_logging(log_level: str = None, log_format: str = 'json') -> None:
     level = getattr(logging, log_level.upper(), logging.INFO)
     
     # Remove existing handlers
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
@@ -77,7 +136,9 @@ def setup_logging(log_level: str = None, log_format: str = 'json') -> None:
     console_handler.setLevel(level)
     
     # Create file handler for errors
-    error_handler = logging.FileHandler('errors.log')
+    error_handler = logging.handlers.RotatingFileHandler(
+        'errors.log', maxBytes=10_000_000, backupCount=3
+    )
     error_handler.setLevel(logging.ERROR)
     
     # Set formatter based on format type
@@ -99,10 +160,14 @@ def setup_logging(log_level: str = None, log_format: str = 'json') -> None:
         console_handler.setFormatter(text_formatter)
         error_handler.setFormatter(text_formatter)
     
-    # Configure root logger
+    # Configure root logger; formatting and I/O happen on the listener thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, error_handler, respect_handler_level=True
+    )
+    _listener.start()
     root_logger.setLevel(level)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(error_handler)
+    root_logger.addHandler(_ExcInfoQueueHandler(log_queue))
     
     # Set specific loggers
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -113,7 +178,71 @@ def setup_logging(log_level: str = None, log_format: str = 'json') -> None:
     logger.info(f"Logging configured: level={log_level}, format={log_format}")
 
 
-def get_logger(name: str) -> logging.Logger:
+def setup_worker_logging(log_level: str = None) -> None:
+    """
+    Configure logging for pool worker processes
+    
+    Workers log plain text to stderr; the parent process owns the queue
+    listener and errors.log.
+    
+    Args:
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    
+    if log_level is None:
+        log_level = os.getenv('LOG_LEVEL', 'INFO')
+    
+    logging.basicConfig(
+        level=getattr(logging, log_level.upper(), logging.INFO),
+        format='%(asctime)s - %(process)d - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stderr,
+        force=True
+    )
+
+
+def _stop_listener() -> None:
+    """Flush queued records on interpreter exit"""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
+def _coerce_context(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Ensure context values are JSON serializable"""
+    return {
+        key: value if isinstance(value, (dict, list, str, int, float, bool, type(None))) else str(value)
+        for key, value in kwargs.items()
+    }
+
+
+class _ContextLogger(logging.LoggerAdapter):
+    """Logger adapter adding *_with_context methods for structured logging"""
+    
+    def process(self, msg, kwargs):
+        # Pass caller-supplied `extra` through untouched
+        return msg, kwargs
+    
+    def info_with_context(self, msg: str, **kwargs):
+        """Log at INFO with additional context fields"""
+        self.log(logging.INFO, msg, extra=_coerce_context(kwargs), stacklevel=2)
+    
+    def error_with_context(self, msg: str, **kwargs):
+        """Log at ERROR with additional context fields"""
+        self.log(logging.ERROR, msg, extra=_coerce_context(kwargs), stacklevel=2)
+    
+    def warning_with_context(self, msg: str, **kwargs):
+        """Log at WARNING with additional context fields"""
+        self.log(logging.WARNING, msg, extra=_coerce_context(kwargs), stacklevel=2)
+
+
+@functools.lru_cache(maxsize=128)
+def get_logger(name: str) -> _ContextLogger:
     """
     Get a logger instance with structured logging support
     
@@ -121,26 +250,6 @@ def get_logger(name: str) -> logging.Logger:
         name: Logger name (usually __name__)
     
     Returns:
-        Configured logger instance
+        Logger adapter with info/error/warning_with_context methods
     """
-    logger = logging.getLogger(name)
-    
-    # Add convenience methods for structured logging
-    def log_with_context(level: int, message: str, **kwargs):
-        """Log with additional context fields"""
-        extra = {}
-        for key, value in kwargs.items():
-            # Ensure values are JSON serializable
-            if isinstance(value, (dict, list, str, int, float, bool, type(None))):
-                extra[key] = value
-            else:
-                extra[key] = str(value)
-        
-        logger.log(level, message, extra=extra)
-    
-    # Add methods to logger
-    logger.info_with_context = lambda msg, **kwargs: log_with_context(logging.INFO, msg, **kwargs)
-    logger.error_with_context = lambda msg, **kwargs: log_with_context(logging.ERROR, msg, **kwargs)
-    logger.warning_with_context = lambda msg, **kwargs: log_with_context(logging.WARNING, msg, **kwargs)
-    
-    return logger
\ No newline at end of file
+    return _ContextLogger(logging.getLogger(name), {})
@@ -1,9 +1,12 @@
 import os
 import asyncio
-import threading
+import heapq
+import logging
 import signal
-import sys
-from datetime import datetime, timezone, time
+from bisect import bisect_left
+from collections import deque
+from operator import attrgetter
+from datetime import datetime, timezone, time, timedelta
 from dotenv import load_dotenv
 import json
 
@@ -12,24 +15,84 @@ from typing import List, Dict, Optional, Any
 from rss_parser import AsyncRSSParser
 from models import Article, DigestConfig, FeedCategory
 from slack_bot import AINewsSlackBot
-from llm_summarizer import create_summarizer
 from logger_config import setup_logging, get_logger
 from utils.single_instance import SingleInstance
 from utils.cache_manager import CacheManager
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Fall back to the default asyncio event loop
 
-# Configure structured logging
-setup_logging()
 logger = get_logger(__name__)
 
 
+def _compute_next_digest(now: datetime, digest_config: Dict[str, Any], digest_time: time,
+                         last_digest_date) -> Optional[datetime]:
+    """Return when the next digest is due, or None if digests are off"""
+    schedule = digest_config.get('schedule')
+    if not digest_config.get('enabled') or schedule not in ('daily', 'weekly'):
+        return None
+    
+    # Today's slot stays due until a digest has been sent today
+    due = datetime.combine(now.date(), digest_time, tzinfo=timezone.utc)
+    if last_digest_date == now.date():
+        due += timedelta(days=1)
+    if schedule == 'weekly':
+        due += timedelta(days=-due.weekday() % 7)  # Mondays only
+    return due
+
+
+def _published_after(articles: List[Article], cutoff: datetime) -> List[Article]:
+    """Slice newest-first parser output down to articles published after cutoff"""
+    end = bisect_left(articles, -cutoff.timestamp(), key=lambda a: -a.sort_ts)
+    return articles[:end]
+
+
+def _digest_blocks_for(i: int, article: Article, now_utc: datetime) -> List[Dict[str, Any]]:
+    """Build the numbered digest blocks for one article"""
+    return [
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*{i}.* <{article.link}|{article.title}>"
+            }
+        },
+        *([{
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"🤖 {article.ai_summary}"
+            }
+        }] if article.ai_summary else []),
+        {
+            "type": "context",
+            "elements": [{
+                "type": "mrkdwn",
+                "text": f"{article.feed_name} | {(article.published or now_utc).strftime('%Y-%m-%d %H:%M UTC')}"
+            }]
+        },
+        {"type": "divider"}
+    ]
+
+
 class AsyncAINewsBot:
     def __init__(self):
         self.shutdown_event = asyncio.Event()
+        # Set to wake the scheduler early (shutdown or digest schedule change)
+        self.scheduler_wakeup = asyncio.Event()
+        # /ai-news-latest fetch shared by concurrent requests, reused until expiry
+        self._latest_task: Optional[asyncio.Task] = None
+        # Resolved with headline-only blocks once the articles are picked
+        self._latest_preview: Optional[asyncio.Future] = None
+        self._latest_expires = 0.0
         self.cache_manager = CacheManager(max_entries=5000, expiry_days=7)
-        self.slack_thread = None
         # Load configuration
         self.slack_bot_token = os.getenv('SLACK_BOT_TOKEN')
         self.slack_app_token = os.getenv('SLACK_APP_TOKEN')
@@ -38,9 +101,11 @@ class AsyncAINewsBot:
         
         # LLM configuration
         self.llm_backend = os.getenv('LLM_BACKEND', 'ollama')
-        self.llm_model = os.getenv('LLM_MODEL', 'llama3.2')
+        self.llm_model = os.getenv('LLM_MODEL', 'llama3.2:3b-instruct-q4_K_M')
         self.llm_base_url = os.getenv('LLM_BASE_URL', 'http://localhost:11434')
         self.enable_summaries = os.getenv('ENABLE_LLM_SUMMARIES', 'true').lower() == 'true'
+        # Defaults to the Ollama server's parallel slots so in-flight requests batch together
+        self.llm_concurrency = int(os.getenv('LLM_CONCURRENCY', os.getenv('OLLAMA_NUM_PARALLEL', 4)))
         
         # Validate configuration
         if not all([self.slack_bot_token, self.slack_app_token, self.channel_id]):
@@ -63,6 +128,7 @@ class AsyncAINewsBot:
         self.summarizer = None
         if self.enable_summaries:
             try:
+                from llm_summarizer import create_summarizer
                 if self.llm_backend in ['transformer', 'flan-t5']:
                     self.summarizer = create_summarizer(
                         backend=self.llm_backend,
@@ -86,6 +152,7 @@ class AsyncAINewsBot:
         
         # Digest feature settings
         self.digest_config = self._load_digest_config()
+        self._digest_time = self._parse_digest_time(self.digest_config.get('time', '09:00'))
         self._schedule_digest_if_enabled()
         
         logger.info_with_context(
@@ -93,48 +160,47 @@ class AsyncAINewsBot:
             feeds_count=len(self.rss_feeds),
             keywords_count=len(self.ai_keywords),
             llm_backend=self.llm_backend,
+            llm_concurrency=self.llm_concurrency,
             summaries_enabled=self.enable_summaries
         )
+        if self.summarizer and self.llm_backend == 'ollama':
+            logger.info(
+                f"Ollama client settings: concurrency={self.llm_concurrency}, "
+                f"keep_alive={self.summarizer.keep_alive}, "
+                f"server OLLAMA_NUM_PARALLEL={os.getenv('OLLAMA_NUM_PARALLEL', 'unset')}, "
+                f"OLLAMA_MAX_LOADED_MODELS={os.getenv('OLLAMA_MAX_LOADED_MODELS', 'unset')}"
+            )
     
     def _get_diverse_articles(self, articles: List[Article], max_articles: int) -> List[Article]:
         """Get a diverse selection of articles across different sources"""
         # Group articles by source
         articles_by_source: Dict[str, List[Article]] = {}
         for article in articles:
-            source = article.feed_name
-            if source not in articles_by_source:
-                articles_by_source[source] = []
-            articles_by_source[source].append(article)
-        
-        # Sort each source's articles by date
-        for source in articles_by_source:
-            articles_by_source[source].sort(
-                key=lambda x: x.published or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True
-            )
+            articles_by_source.setdefault(article.feed_name, []).append(article)
+        
+        # One newest-first queue per source, visited in name order; no source
+        # can contribute more than max_articles, so only those are ranked
+        source_queues = deque(
+            deque(heapq.nlargest(
+                max_articles,
+                source_articles,
+                key=attrgetter('sort_ts')
+            ))
+            for _, source_articles in sorted(articles_by_source.items())
+        )
         
-        # Round-robin selection from each source
+        # Round-robin selection: take one article and requeue the source if it has more
         selected = []
-        source_indices = {source: 0 for source in articles_by_source}
-        
-        while len(selected) < max_articles:
-            added_this_round = False
-            for source in sorted(articles_by_source.keys()):  # Sort for consistent ordering
-                if source_indices[source] < len(articles_by_source[source]):
-                    selected.append(articles_by_source[source][source_indices[source]])
-                    source_indices[source] += 1
-                    added_this_round = True
-                    if len(selected) >= max_articles:
-                        break
-            
-            # If no articles were added this round, all sources are exhausted
-            if not added_this_round:
-                break
+        while source_queues and len(selected) < max_articles:
+            queue = source_queues.popleft()
+            selected.append(queue.popleft())
+            if queue:
+                source_queues.append(queue)
         
         logger.info(f"Selected {len(selected)} articles from {len(articles_by_source)} sources")
         return selected
     
-    def reload_configuration(self):
+    async def reload_configuration(self):
         """Reload configuration from file"""
         logger.info("Reloading configuration...")
         try:
@@ -146,6 +212,8 @@ class AsyncAINewsBot:
                 feeds_count=len(self.rss_feeds),
                 keywords_count=len(self.ai_keywords)
             )
+            # Don't serve /ai-news-latest results filtered by the old keywords
+            self._latest_expires = 0.0
         except Exception as e:
             logger.error_with_context(
                 "Error reloading configuration",
@@ -158,18 +226,31 @@ class AsyncAINewsBot:
         digest_file = "digest_config.json"
         if os.path.exists(digest_file):
             try:
-                with open(digest_file, 'r') as f:
-                    data = json.load(f)
+                with open(digest_file, 'rb') as f:
+                    data = orjson.loads(f.read()) if orjson else json.load(f)
                     return data
             except Exception as e:
                 logger.error(f"Error loading digest config: {e}")
         return {'enabled': False, 'schedule': None, 'time': '09:00'}
     
+    def _parse_digest_time(self, digest_time_str: str) -> time:
+        """Parse the configured HH:MM digest time"""
+        try:
+            hour, minute = map(int, digest_time_str.split(':'))
+            return time(hour, minute)
+        except Exception as e:
+            logger.error(f"Invalid digest time {digest_time_str!r}, using 09:00: {e}")
+            return time(9, 0)
+    
     def _save_digest_config(self):
         """Save digest configuration to file"""
         try:
-            with open("digest_config.json", 'w') as f:
-                json.dump(self.digest_config, f, indent=2)
+            if orjson:
+                with open("digest_config.json", 'wb') as f:
+                    f.write(orjson.dumps(self.digest_config, option=orjson.OPT_INDENT_2))
+            else:
+                with open("digest_config.json", 'w') as f:
+                    json.dump(self.digest_config, f, indent=2)
         except Exception as e:
             logger.error(f"Error saving digest config: {e}")
     
@@ -180,7 +261,7 @@ class AsyncAINewsBot:
             digest_time = self.digest_config.get('time', '09:00')
             logger.info(f"Digest enabled: {schedule} at {digest_time}")
     
-    def set_digest_schedule(self, schedule: str):
+    async def set_digest_schedule(self, schedule: str):
         """Update digest schedule"""
         if schedule == 'off':
             self.digest_config['enabled'] = False
@@ -188,110 +269,119 @@ class AsyncAINewsBot:
         else:
             self.digest_config['enabled'] = True
             self.digest_config['schedule'] = schedule
+        self._digest_time = self._parse_digest_time(self.digest_config.get('time', '09:00'))
         
         self._save_digest_config()
+        self.scheduler_wakeup.set()
         logger.info(f"Digest schedule updated: {schedule}")
     
     async def generate_summaries_batch(self, articles: List[Article]) -> None:
-        """Generate summaries for articles in parallel (if possible)"""
+        """Generate summaries for articles concurrently"""
         if not self.summarizer:
             return
 
         logger.info(f"Generating AI summaries for {len(articles)} articles...")
 
-        # For now, we'll process summaries sequentially
-        # (Most LLM APIs don't handle concurrent requests well)
-        for article in articles:
-            try:
-                # Convert Article to dict for summarizer
-                article_dict = article.to_dict()
-                summary = self.summarizer.summarize(article_dict)
-                if summary:
-                    article.ai_summary = summary
-            except Exception as e:
-                logger.warning_with_context(
-                    "Failed to summarize article",
-                    article_title=article.title[:50],
-                    article_id=article.id,
-                    error=str(e)
-                )
-    
-    def handle_latest_articles_request(self, respond):
-        """Handle slash command request for latest articles"""
-        # Run the async function in a new event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # HTTP backends keep up to llm_concurrency requests in flight;
+        # local models run the list as one batch in a worker thread
+        article_dicts = [article.to_dict() for article in articles]
         try:
-            loop.run_until_complete(self._handle_latest_articles_async(respond))
-        finally:
-            loop.close()
+            summaries = await self.summarizer.asummarize_many(
+                article_dicts, concurrency=self.llm_concurrency
+            )
+        except Exception as e:
+            logger.warning_with_context(
+                "Failed to summarize articles",
+                articles_count=len(articles),
+                error=str(e)
+            )
+            return
+        
+        for article, summary in zip(articles, summaries):
+            if summary:
+                article.ai_summary = summary
     
-    async def _handle_latest_articles_async(self, respond):
-        """Async handler for latest articles request"""
+    async def handle_latest_articles_request(self, respond):
+        """Handle slash command request for latest articles"""
         try:
             logger.info("Handling /ai-news-latest command")
-            respond("🔄 Fetching latest AI articles...")
+            loop = asyncio.get_running_loop()
             
-            # Fetch latest articles without using cache
-            all_articles = await self.rss_parser.parse_multiple_feeds_async(
-                keywords=self.ai_keywords,
-                use_cache=False
-            )
-            
-            if not all_articles:
-                respond("📭 No articles found at this time. Please try again later.")
-                return
-            
-            # Filter articles from the last 7 days
-            from datetime import timedelta
-            cutoff_time = datetime.now(timezone.utc) - timedelta(days=7)
-            recent_articles = [
-                article for article in all_articles
-                if article.published and article.published > cutoff_time
-            ]
-            
-            if not recent_articles:
-                respond("📭 No articles found in the last 7 days. RSS feeds may contain older content.")
-                return
-            
-            # Sort by date (newest first)
-            recent_articles.sort(
-                key=lambda x: x.published or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True
-            )
-            
-            # Get top 5 diverse articles from recent ones
-            diverse_articles = self._get_diverse_articles(recent_articles, 5)
+            # Concurrent requests share one fetch, and its result is reused for a minute
+            # after the fetch started; a failed fetch is retried on the next request
+            task = self._latest_task
+            if (task is None or task.done() and (
+                    task.cancelled() or task.exception() or loop.time() >= self._latest_expires)):
+                self._latest_preview = loop.create_future()
+                task = self._latest_task = asyncio.create_task(self._fetch_latest_response())
+                self._latest_expires = loop.time() + 60
+            # Post a placeholder, then update it in place as results arrive
+            in_progress = not task.done()
+            if in_progress:
+                await respond("🔄 Fetching latest AI articles...")
+                # Show the headlines while their summaries are generated
+                preview = self._latest_preview
+                await asyncio.wait((preview, task), return_when=asyncio.FIRST_COMPLETED)
+                if preview.done() and not task.done():
+                    await respond(replace_original=True, **preview.result())
             
-            # Generate summaries
-            await self.generate_summaries_batch(diverse_articles)
-            
-            # Format response
-            blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"🔥 Latest AI Articles - {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}"
-                    }
-                },
-                {"type": "divider"}
-            ]
-            
-            for article in diverse_articles:
-                # Convert Article to dict for Slack formatting
-                blocks.extend(self.slack_bot.format_article_block(article.to_dict()))
-            
-            # Remove last divider
-            if blocks[-1].get("type") == "divider":
-                blocks.pop()
-            
-            respond(blocks=blocks, text="Latest AI articles")
-            logger.info(f"Posted {len(diverse_articles)} latest articles via slash command")
+            # Shielded so one request timing out doesn't cancel the fetch for the others
+            await respond(replace_original=in_progress, **await asyncio.shield(task))
             
         except Exception as e:
             logger.error(f"Error handling latest articles request: {e}")
-            respond("❌ Sorry, an error occurred while fetching articles. Please try again later.")
+            await respond("❌ Sorry, an error occurred while fetching articles. Please try again later.")
+    
+    async def _fetch_latest_response(self) -> Dict[str, Any]:
+        """Fetch and summarize the latest articles, returning the respond() arguments"""
+        # Fetch latest articles without using cache
+        all_articles = await self.rss_parser.parse_multiple_feeds_async(
+            keywords=self.ai_keywords,
+            use_cache=False
+        )
+        
+        if not all_articles:
+            return {"text": "📭 No articles found at this time. Please try again later."}
+        
+        # Filter articles from the last 7 days (parser output is already newest first)
+        cutoff_time = datetime.now(timezone.utc) - timedelta(days=7)
+        recent_articles = _published_after(all_articles, cutoff_time)
+        
+        if not recent_articles:
+            return {"text": "📭 No articles found in the last 7 days. RSS feeds may contain older content."}
+        
+        # Get top 5 diverse articles from recent ones
+        diverse_articles = self._get_diverse_articles(recent_articles, 5)
+        self._latest_preview.set_result(self._latest_articles_response(diverse_articles))
+        
+        # Generate summaries
+        await self.generate_summaries_batch(diverse_articles)
+        
+        logger.info(f"Prepared {len(diverse_articles)} latest articles for slash command")
+        return self._latest_articles_response(diverse_articles)
+    
+    def _latest_articles_response(self, articles: List[Article]) -> Dict[str, Any]:
+        """Build the respond() arguments listing the latest articles"""
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"🔥 Latest AI Articles - {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}"
+                }
+            },
+            {"type": "divider"}
+        ]
+        
+        for article in articles:
+            # Convert Article to dict for Slack formatting
+            blocks.extend(self.slack_bot.format_article_block(article.to_dict()))
+        
+        # Remove last divider
+        if blocks[-1].get("type") == "divider":
+            blocks.pop()
+        
+        return {"blocks": blocks, "text": "Latest AI articles"}
     
     async def check_feeds_async(self):
         """Check all RSS feeds for new articles asynchronously"""
@@ -305,11 +395,12 @@ class AsyncAINewsBot:
             )
             
             if new_articles:
-                logger.info_with_context(
-                    "Found new articles",
-                    articles_count=len(new_articles),
-                    sources=list(set(a.feed_name for a in new_articles))
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info_with_context(
+                        "Found new articles",
+                        articles_count=len(new_articles),
+                        sources=sorted({a.feed_name for a in new_articles})
+                    )
                 
                 # Limit articles per update
                 max_articles_per_update = int(os.getenv('MAX_ARTICLES_PER_UPDATE', 10))
@@ -323,7 +414,7 @@ class AsyncAINewsBot:
                 
                 # Post to Slack (convert to dicts for compatibility)
                 articles_dicts = [article.to_dict() for article in new_articles]
-                self.slack_bot.post_articles(articles_dicts)
+                await self.slack_bot.post_articles(articles_dicts)
             else:
                 logger.info("No new articles found")
                 
@@ -333,6 +424,7 @@ class AsyncAINewsBot:
     async def generate_digest(self, period: str = "daily"):
         """Generate a digest of top articles"""
         logger.info(f"Generating {period} digest...")
+        now_utc = datetime.now(timezone.utc)
         
         try:
             # Fetch all articles without cache to get recent ones
@@ -346,17 +438,13 @@ class AsyncAINewsBot:
                 return
             
             # Filter articles based on period
-            from datetime import timedelta
-            cutoff_time = datetime.now(timezone.utc)
+            cutoff_time = now_utc
             if period == "daily":
                 cutoff_time -= timedelta(days=1)
             elif period == "weekly":
                 cutoff_time -= timedelta(days=7)
             
-            recent_articles = [
-                article for article in all_articles
-                if article.published and article.published > cutoff_time
-            ]
+            recent_articles = _published_after(all_articles, cutoff_time)
             
             if not recent_articles:
                 logger.info(f"No articles in the {period} period")
@@ -368,15 +456,13 @@ class AsyncAINewsBot:
                     article.to_dict()
                 )
             
-            # Sort by priority score and date
-            recent_articles.sort(
-                key=lambda x: (x.priority_score, x.published or datetime.min.replace(tzinfo=timezone.utc)),
-                reverse=True
-            )
-            
-            # Get top articles (more for weekly)
+            # Get top articles by priority score and date (more for weekly)
             max_articles = 10 if period == "daily" else 20
-            top_articles = recent_articles[:max_articles]
+            top_articles = heapq.nlargest(
+                max_articles,
+                recent_articles,
+                key=attrgetter('priority_score', 'sort_ts')
+            )
             
             # Generate summaries
             await self.generate_summaries_batch(top_articles)
@@ -387,7 +473,7 @@ class AsyncAINewsBot:
                     "type": "header",
                     "text": {
                         "type": "plain_text",
-                        "text": f"📅 {period.title()} AI News Digest - {datetime.now().strftime('%Y-%m-%d')}"
+                        "text": f"📅 {period.title()} AI News Digest - {now_utc.strftime('%Y-%m-%d')}"
                     }
                 },
                 {
@@ -402,35 +488,7 @@ class AsyncAINewsBot:
             
             # Add articles (without feedback buttons for digest)
             for i, article in enumerate(top_articles, 1):
-                # Add number
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*{i}.* <{article.link}|{article.title}>"
-                    }
-                })
-                
-                # Add summary if available
-                if article.ai_summary:
-                    blocks.append({
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"🤖 {article.ai_summary}"
-                        }
-                    })
-                
-                # Add metadata
-                blocks.append({
-                    "type": "context",
-                    "elements": [{
-                        "type": "mrkdwn",
-                        "text": f"{article.feed_name} | {(article.published or datetime.now(timezone.utc)).strftime('%Y-%m-%d %H:%M UTC')}"
-                    }]
-                })
-                
-                blocks.append({"type": "divider"})
+                blocks.extend(_digest_blocks_for(i, article, now_utc))
             
             # Add trending sources
             trending = self.slack_bot.feedback_manager.get_trending_sources(3)
@@ -454,18 +512,19 @@ class AsyncAINewsBot:
                     })
             
             # Post digest
-            self.slack_bot.app.client.chat_postMessage(
+            await self.slack_bot.app.client.chat_postMessage(
                 channel=self.channel_id,
                 blocks=blocks,
                 text=f"{period.title()} AI News Digest"
             )
             
-            logger.info_with_context(
-                "Posted digest",
-                period=period,
-                articles_count=len(top_articles),
-                trending_sources=[s[0] for s in trending[:3]] if trending else []
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info_with_context(
+                    "Posted digest",
+                    period=period,
+                    articles_count=len(top_articles),
+                    trending_sources=[s[0] for s in trending[:3]] if trending else []
+                )
             
         except Exception as e:
             logger.error(f"Error generating digest: {e}")
@@ -478,97 +537,117 @@ class AsyncAINewsBot:
         logger.info(f"Scheduler started. Checking feeds every {self.check_interval} minutes.")
         
         last_digest_date = None
+        loop = asyncio.get_running_loop()
+        next_check = loop.time() + self.check_interval * 60
+        # Reused across timed-out sleeps; replaced only after it fires
+        wakeup_task: Optional[asyncio.Task] = None
         
         # Keep running
         while True:
-            # Check if digest should be sent
-            if self.digest_config.get('enabled'):
-                now = datetime.now(timezone.utc)
-                today_date = now.date()
-                digest_time_str = self.digest_config.get('time', '09:00')
-                
-                try:
-                    # Parse digest time
-                    hour, minute = map(int, digest_time_str.split(':'))
-                    digest_time = time(hour, minute)
-                    
-                    # Check if it's time for daily digest
-                    if (self.digest_config['schedule'] == 'daily' and 
-                        now.time() >= digest_time and 
-                        last_digest_date != today_date):
-                        
-                        await self.generate_digest('daily')
-                        last_digest_date = today_date
-                    
-                    # Check if it's time for weekly digest (on Mondays)
-                    elif (self.digest_config['schedule'] == 'weekly' and 
-                          now.weekday() == 0 and  # Monday
-                          now.time() >= digest_time and 
-                          last_digest_date != today_date):
-                        
-                        await self.generate_digest('weekly')
-                        last_digest_date = today_date
-                        
-                except Exception as e:
-                    logger.error(f"Error checking digest schedule: {e}")
+            # Send the digest if it is due
+            now = datetime.now(timezone.utc)
+            next_digest = _compute_next_digest(
+                now, self.digest_config, self._digest_time, last_digest_date
+            )
+            if next_digest is not None and next_digest <= now:
+                await self.generate_digest(self.digest_config['schedule'])
+                last_digest_date = now.date()
+                continue
             
-            # Wait for the specified interval or shutdown signal
-            try:
-                await asyncio.wait_for(
-                    self.shutdown_event.wait(),
-                    timeout=min(self.check_interval * 60, 300)
-                )
-                if self.shutdown_event.is_set():
-                    logger.info("Shutdown requested, stopping scheduler...")
-                    break
-            except asyncio.TimeoutError:
-                pass  # Normal timeout, continue loop
+            # Sleep until the next feed check or digest, whichever comes first
+            timeout = next_check - loop.time()
+            if next_digest is not None:
+                timeout = min(timeout, (next_digest - now).total_seconds())
+            if wakeup_task is None or wakeup_task.done():
+                wakeup_task = asyncio.create_task(self.scheduler_wakeup.wait())
+            await asyncio.wait({wakeup_task}, timeout=max(0, timeout))
+            if wakeup_task.done():
+                self.scheduler_wakeup.clear()
+            
+            if self.shutdown_event.is_set():
+                logger.info("Shutdown requested, stopping scheduler...")
+                wakeup_task.cancel()
+                break
             
             # Check feeds
-            await self.check_feeds_async()
+            if loop.time() >= next_check:
+                await self.check_feeds_async()
+                # Advance from the deadline, not the finish time, so checks don't drift
+                next_check += self.check_interval * 60
+                if next_check <= loop.time():
+                    # A check overran a whole interval; skip the missed tick
+                    next_check = loop.time() + self.check_interval * 60
     
     def start(self):
         """Start the bot"""
         logger.info("Starting Async AI News Bot...")
         
+        # Slack socket mode and the scheduler share one event loop
+        asyncio.run(self._amain())
+    
+    async def _amain(self):
+        """Run the Slack bot and the feed scheduler on the same event loop"""
         # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._signal_handler, sig)
         
-        # Start Slack bot in a separate thread
-        self.slack_thread = threading.Thread(target=self.slack_bot.start, daemon=False)
-        self.slack_thread.start()
+        # Connect to Slack while the cache is cleaned and the startup message is posted
+        slack_task = asyncio.create_task(self.slack_bot.start_async())
         
-        # Give Slack bot time to connect
-        import time
-        time.sleep(2)
+        # Clean cache on startup
+        logger.info("Cleaning feed cache...")
+        await asyncio.gather(
+            asyncio.to_thread(self.cache_manager.clean_feed_cache, "feed_cache.json"),
+            self._post_startup_message(),
+            self._warmup_summarizer()
+        )
         
-        # Post startup message
         try:
-            self.slack_bot.app.client.chat_postMessage(
+            await self.run_scheduler_async()
+        finally:
+            # Scheduler has stopped; disconnect from Slack and close feed connections
+            await self.slack_bot.stop_async()
+            slack_task.cancel()
+            await self.rss_parser.close()
+            if self.summarizer:
+                await self.summarizer.aclose()
+    
+    async def _warmup_summarizer(self):
+        """Load the LLM before the first feed check needs it"""
+        if not self.summarizer:
+            return
+        try:
+            await asyncio.to_thread(self.summarizer.warmup)
+        except Exception as e:
+            logger.warning(f"LLM warmup failed: {e}")
+    
+    async def _post_startup_message(self):
+        """Announce that the bot is online"""
+        try:
+            await self.slack_bot.app.client.chat_postMessage(
                 channel=self.channel_id,
                 text="🚀 AI News Bot is now online with improved stability! I'll monitor RSS feeds concurrently for faster updates."
             )
         except Exception as e:
             logger.error(f"Error posting startup message: {e}")
-        
-        # Clean cache on startup
-        logger.info("Cleaning feed cache...")
-        self.cache_manager.clean_feed_cache("feed_cache.json")
-        
-        # Start the async scheduler
-        asyncio.run(self.run_scheduler_async())
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum):
         """Handle shutdown signals gracefully."""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.shutdown_event.set()
-        # Slack bot doesn't have a stop method, just exit gracefully
-        sys.exit(0)
+        self.scheduler_wakeup.set()
 
 
 def main():
     """Main entry point"""
+    # Process-wide setup lives here, not at import time: spawned parse
+    # workers re-import this module and must not repeat it
+    load_dotenv()
+    setup_logging()
+    if uvloop is not None:
+        uvloop.install()
+    
     # Ensure single instance
     with SingleInstance('/tmp/slackwire.lock'):
         try:
@@ -14,6 +14,16 @@ from dotenv import load_dotenv
 from database.manager import DatabaseManager
 from logger_config import setup_logging, get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as parse_iso_timestamp
+except ImportError:
+    parse_iso_timestamp = None
+
 # Load environment variables
 load_dotenv()
 
@@ -22,6 +32,18 @@ setup_logging()
 logger = get_logger(__name__)
 
 
+def _read_json(filepath: str) -> dict:
+    """Read and parse a JSON file (blocking)"""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _fromisoformat(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing Z"""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
 async def load_json_file(filepath: str) -> dict:
     """Load data from a JSON file"""
     if not os.path.exists(filepath):
@@ -29,10 +51,9 @@ async def load_json_file(filepath: str) -> dict:
         return {}
 
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            logger.info(f"Loaded {len(data)} entries from {filepath}")
-            return data
+        data = await asyncio.to_thread(_read_json, filepath)
+        logger.info(f"Loaded {len(data)} entries from {filepath}")
+        return data
     except Exception as e:
         logger.error(f"Error loading {filepath}: {e}")
         return {}
@@ -46,21 +67,26 @@ async def migrate_feed_cache(db: DatabaseManager) -> int:
     if not cache_data:
         return 0
 
+    # Look up every cached id in one query rather than one per entry
+    existing = await db.bulk_check_articles(list(cache_data))
+
+    # ciso8601 parses ISO timestamps in C; bind the parser once for the loop
+    parse_iso = parse_iso_timestamp or _fromisoformat
+
     count = 0
     for article_id, timestamp in cache_data.items():
         try:
             # Parse timestamp
             if isinstance(timestamp, str):
                 # Try to parse ISO format
-                ts = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                ts = parse_iso(timestamp)
             else:
                 # Assume it's already a datetime or timestamp
                 ts = datetime.fromtimestamp(timestamp)
 
             # The article_id is usually the hash itself
             # We'll need to store minimal info since we don't have full article data
-            exists = await db.article_exists(article_id)
-            if not exists:
+            if not existing[article_id]:
                 # Note: This is a simplified migration
                 # In production, you might want to fetch full article data
                 count += 1
@@ -80,25 +106,23 @@ async def migrate_feedback(db: DatabaseManager) -> int:
     if not feedback_data:
         return 0
 
-    count = 0
+    rows = []
     for article_id, feedbacks in feedback_data.items():
         if isinstance(feedbacks, list):
             for feedback in feedbacks:
-                try:
-                    success = await db.save_feedback(
-                        article_id=article_id,
-                        user_id=feedback.get('user_id', 'unknown'),
-                        is_positive=feedback.get('is_positive', False),
-                        feed_name=feedback.get('source')
-                    )
-                    if success:
-                        count += 1
-                except Exception as e:
-                    logger.error(f"Error migrating feedback for {article_id}: {e}")
+                rows.append({
+                    'article_id': article_id,
+                    'user_id': feedback.get('user_id', 'unknown'),
+                    'is_positive': feedback.get('is_positive', False),
+                    'feed_name': feedback.get('source')
+                })
         else:
             # Handle old format if different
             logger.warning(f"Unexpected feedback format for {article_id}")
 
+    # One transaction and a few multi-row upserts instead of a round-trip per row
+    count = await db.save_feedback_bulk(rows)
+
     logger.info(f"Migrated {count} feedback entries")
     return count
 
@@ -259,13 +283,20 @@ async def main():
         logger.info("Initializing database tables...")
         await db.initialize_database()
 
-        # Run migrations
-        results = {
-            'feed_cache': await migrate_feed_cache(db),
-            'feedback': await migrate_feedback(db),
-            'digest_config': await migrate_digest_config(db),
-            'config': await migrate_config_yaml(db)
+        # Run migrations concurrently; one failure doesn't abort the others
+        migrations = {
+            'feed_cache': migrate_feed_cache(db),
+            'feedback': migrate_feedback(db),
+            'digest_config': migrate_digest_config(db),
+            'config': migrate_config_yaml(db)
         }
+        outcomes = await asyncio.gather(*migrations.values(), return_exceptions=True)
+        results = {}
+        for name, outcome in zip(migrations, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error migrating {name}: {outcome}")
+                outcome = 0
+            results[name] = outcome
 
         # Summary
         logger.info("=" * 60)
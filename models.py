@@ -21,7 +21,7 @@ class DigestSchedule(str, Enum):
     OFF = "off"
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Represents an article from an RSS feed."""
     id: str
@@ -33,6 +33,11 @@ class Article:
     category: FeedCategory = FeedCategory.GENERAL
     ai_summary: Optional[str] = None
     priority_score: float = 0.0
+    sort_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Cache the newest-first sort key as epoch seconds (0.0 when undated)."""
+        self.sort_ts = self.published.timestamp() if self.published else 0.0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -71,7 +76,7 @@ class Article:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSFeed:
     """Configuration for an RSS feed."""
     url: str
@@ -101,7 +106,7 @@ class RSSFeed:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackEntry:
     """User feedback for an article."""
     article_id: str
@@ -121,7 +126,7 @@ class FeedbackEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DigestConfig:
     """Configuration for digest notifications."""
     enabled: bool = False
@@ -149,7 +154,7 @@ class DigestConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackMessage:
     """Represents a Slack message to be posted."""
     channel_id: str
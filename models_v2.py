@@ -1,10 +1,17 @@
 """Enhanced data models with Pydantic validation for SlackWire application."""
 
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import re
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Literal
 from enum import Enum
 from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 
+_FEED_NAME_RE = re.compile(r'^[\w\s\-\.]+$')
+_TIME_RE = re.compile(r'^([01]\d|2[0-3]):[0-5]\d$')
+
+# Shared by every article's blocks; it is only serialized, never mutated
+_DIVIDER_BLOCK: Dict[str, Any] = {"type": "divider"}
+
 
 class FeedCategory(str, Enum):
     """Categories for RSS feeds."""
@@ -21,6 +28,13 @@ class DigestSchedule(str, Enum):
     OFF = "off"
 
 
+# Field types: pydantic validates a Literal with a plain string check and stores
+# the str itself, where an enum field builds the member and then unwraps it.
+# The enums above stay as named constants for callers.
+FeedCategoryLit = Literal['academic', 'company', 'news', 'general']
+DigestScheduleLit = Literal['daily', 'weekly', 'off']
+
+
 class SlackConfig(BaseModel):
     """Slack bot configuration with validation."""
     bot_token: str = Field(..., min_length=1, pattern="^xoxb-", description="Slack bot OAuth token")
@@ -40,61 +54,58 @@ class Article(BaseModel):
     """Represents an article from an RSS feed with validation."""
     id: str = Field(..., min_length=1, description="Unique article identifier")
     title: str = Field(..., min_length=1, max_length=500, description="Article title")
-    link: HttpUrl = Field(..., description="Article URL")
+    link: str = Field(..., min_length=1, description="Article URL")
     feed_name: str = Field(..., min_length=1, description="Source feed name")
     summary: str = Field(default="", max_length=2000, description="Article summary")
     published: Optional[datetime] = Field(default=None, description="Publication date")
-    category: FeedCategory = Field(default=FeedCategory.GENERAL, description="Feed category")
-    feed_category: Optional[FeedCategory] = Field(default=None, description="Feed category for display")
+    category: FeedCategoryLit = Field(default=FeedCategory.GENERAL.value, description="Feed category")
+    feed_category: Optional[FeedCategoryLit] = Field(default=None, description="Feed category for display")
     ai_summary: Optional[str] = Field(default=None, max_length=1000, description="AI-generated summary")
     priority_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Priority score")
 
     class Config:
         use_enum_values = True
         json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-            HttpUrl: lambda v: str(v)
+            datetime: lambda v: v.isoformat() if v else None
         }
 
-    @field_validator('title', 'summary')
+    @field_validator('link')
     @classmethod
-    def clean_text(cls, v: str) -> str:
-        """Remove excessive whitespace and newlines."""
-        if v:
-            return ' '.join(v.split())
+    def validate_link(cls, v: str) -> str:
+        """Ensure the link is an http(s) URL; feed links are passed to Slack as-is."""
+        if not v.startswith(('http://', 'https://')):
+            raise ValueError('Article link must be an http(s) URL')
         return v
 
-    @field_validator('published')
-    @classmethod
-    def ensure_timezone(cls, v: Optional[datetime]) -> Optional[datetime]:
-        """Ensure datetime has timezone info."""
-        if v and v.tzinfo is None:
-            from datetime import timezone
-            return v.replace(tzinfo=timezone.utc)
-        return v
+    @model_validator(mode='after')
+    def normalize(self):
+        """Collapse whitespace in title/summary and ensure published has timezone info."""
+        # One model-level hook instead of a per-field validator call for each field
+        self.title = ' '.join(self.title.split())
+        if self.summary:
+            self.summary = ' '.join(self.summary.split())
+        if self.published and self.published.tzinfo is None:
+            self.published = self.published.replace(tzinfo=timezone.utc)
+        return self
 
     def to_slack_block(self) -> List[Dict[str, Any]]:
         """Generate Slack block format for this article."""
-        blocks = []
-
         # Title and link
-        blocks.append({
+        blocks = [{
             "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*<{self.link}|{self.title}>*"
-            }
-        })
+            "text": {"type": "mrkdwn", "text": f"*<{self.link}|{self.title}>*"}
+        }]
 
         # Summary or AI summary
-        summary_text = self.ai_summary or self.summary
-        if summary_text:
+        if self.ai_summary:
+            blocks.append({
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"🤖 {self.ai_summary[:500]}"}
+            })
+        elif self.summary:
             blocks.append({
                 "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"{'🤖 ' if self.ai_summary else ''}{summary_text[:500]}"
-                }
+                "text": {"type": "mrkdwn", "text": self.summary[:500]}
             })
 
         # Metadata
@@ -107,7 +118,7 @@ class Article(BaseModel):
             }]
         })
 
-        blocks.append({"type": "divider"})
+        blocks.append(_DIVIDER_BLOCK)
         return blocks
 
 
@@ -115,7 +126,7 @@ class RSSFeed(BaseModel):
     """Configuration for an RSS feed with validation."""
     url: HttpUrl = Field(..., description="RSS feed URL")
     name: str = Field(..., min_length=1, max_length=100, description="Feed name")
-    category: FeedCategory = Field(default=FeedCategory.GENERAL, description="Feed category")
+    category: FeedCategoryLit = Field(default=FeedCategory.GENERAL.value, description="Feed category")
     enabled: bool = Field(default=True, description="Whether feed is active")
     last_fetched: Optional[datetime] = Field(default=None, description="Last successful fetch")
     error_count: int = Field(default=0, ge=0, description="Consecutive error count")
@@ -127,8 +138,7 @@ class RSSFeed(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Ensure name doesn't contain special characters."""
-        import re
-        if not re.match(r'^[\w\s\-\.]+$', v):
+        if not _FEED_NAME_RE.match(v):
             raise ValueError('Feed name can only contain letters, numbers, spaces, hyphens, and dots')
         return v
 
@@ -153,7 +163,6 @@ class FeedbackEntry(BaseModel):
     def ensure_timezone(cls, v: datetime) -> datetime:
         """Ensure datetime has timezone info."""
         if v and v.tzinfo is None:
-            from datetime import timezone
             return v.replace(tzinfo=timezone.utc)
         return v
 
@@ -161,7 +170,7 @@ class FeedbackEntry(BaseModel):
 class DigestConfig(BaseModel):
     """Configuration for digest notifications with validation."""
     enabled: bool = Field(default=False, description="Whether digest is enabled")
-    schedule: Optional[DigestSchedule] = Field(default=None, description="Digest schedule")
+    schedule: Optional[DigestScheduleLit] = Field(default=None, description="Digest schedule")
     time: str = Field(default="09:00", pattern=r'^\d{2}:\d{2}$', description="Time in HH:MM format")
     last_sent: Optional[datetime] = Field(default=None, description="Last digest sent time")
 
@@ -169,11 +178,7 @@ class DigestConfig(BaseModel):
     @classmethod
     def validate_time(cls, v: str) -> str:
         """Validate time format."""
-        try:
-            hour, minute = map(int, v.split(':'))
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError
-        except (ValueError, AttributeError):
+        if not _TIME_RE.match(v):
             raise ValueError('Time must be in HH:MM format (00:00 to 23:59)')
         return v
 
@@ -189,17 +194,15 @@ class SlackMessage(BaseModel):
     """Represents a Slack message to be posted with validation."""
     channel_id: str = Field(..., pattern=r'^[CG][A-Z0-9]+$', description="Slack channel ID")
     text: str = Field(..., min_length=1, max_length=40000, description="Message text")
-    blocks: Optional[List[Dict[str, Any]]] = Field(default=None, max_items=50, description="Slack blocks")
+    blocks: Optional[List[Dict[str, Any]]] = Field(default=None, max_length=50, description="Slack blocks")
     thread_ts: Optional[str] = Field(default=None, description="Thread timestamp")
 
     @field_validator('blocks')
     @classmethod
     def validate_blocks(cls, v: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
         """Validate Slack blocks structure."""
-        if v:
-            for block in v:
-                if 'type' not in block:
-                    raise ValueError('Each block must have a type')
+        if v and not all('type' in block for block in v):
+            raise ValueError('Each block must have a type')
         return v
 
 
@@ -217,8 +220,8 @@ class AppConfig(BaseModel):
     @field_validator('ai_keywords')
     @classmethod
     def clean_keywords(cls, v: List[str]) -> List[str]:
-        """Clean and deduplicate keywords."""
-        return list(set(k.strip().lower() for k in v if k.strip()))
+        """Clean and deduplicate keywords, keeping their configured order."""
+        return list(dict.fromkeys(k.strip().lower() for k in v if k.strip()))
 
     @field_validator('rss_feeds')
     @classmethod
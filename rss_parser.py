@@ -1,39 +1,337 @@
 import asyncio
 import aiohttp
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import feedparser
 from datetime import datetime, timezone, timedelta
 from dateutil import parser as date_parser
-from typing import List, Dict, Optional, Any
+from email.utils import parsedate_to_datetime
+from typing import Callable, List, Dict, Optional, Any, Set, Tuple
+from functools import lru_cache
+from operator import attrgetter
+import calendar
+import copy
 import hashlib
+import html
+import io
+import multiprocessing
 import json
 import os
+import re
 import yaml
 import time
-from bs4 import BeautifulSoup
 
-from logger_config import get_logger
-from utils.file_lock import atomic_json_file, safe_json_read, safe_json_write
+from logger_config import get_logger, setup_worker_logging
+from utils.file_lock import FileLockManager, atomic_json_file, safe_json_read, safe_json_write
 from utils.cache_manager import CacheManager
 from models import Article, RSSFeed, FeedCategory
 from circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed loader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import ahocorasick  # pyahocorasick: one automaton pass for all keywords
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2 as _keyword_re  # google-re2: linear-time automaton matching
+except ImportError:
+    _keyword_re = re
+
 logger = get_logger(__name__)
 
+# Category lookup by config value, resolved once per feed rather than per entry
+_CATEGORY_BY_VALUE: Dict[str, FeedCategory] = {c.value: c for c in FeedCategory}
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Seen entries are appended to a log between snapshots; past this size it is compacted
+_CACHE_LOG_MAX_BYTES = 1024 * 1024
+# Seen entries kept in memory and in the snapshot; the least recently seen are dropped
+_SEEN_ENTRIES_MAX = 50000
+
+_DC_DATE_TAG = '{http://purl.org/dc/elements/1.1/}date'
+_CONTENT_ENCODED_TAG = '{http://purl.org/rss/1.0/modules/content/}encoded'
+
+# Config path -> (mtime_ns, parsed config); parsers re-parse only when the file changes
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _strip_html(text: str) -> str:
+    """Return the visible text of an HTML snippet with whitespace collapsed"""
+    if HTMLParser is not None:
+        tree = HTMLParser(text)
+        tree.strip_tags(['script', 'style'])
+        text = tree.text(separator=' ')
+    else:
+        # Feed summaries are short, simple markup; a tag regex is enough
+        text = html.unescape(_TAG_RE.sub(' ', _SCRIPT_STYLE_RE.sub(' ', text)))
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _entry_id(entry: Dict[str, Any]) -> str:
+    """Generate unique ID for an entry"""
+    # Use combination of title and link for uniqueness; ids are only dedup
+    # keys, so a short BLAKE2b digest (cheaper than MD5) is enough
+    content = f"{entry.get('title', '')}{entry.get('link', '')}"
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+def _legacy_entry_id(entry: Dict[str, Any]) -> str:
+    """MD5 id that entries were cached under before the switch to BLAKE2b"""
+    content = f"{entry.get('title', '')}{entry.get('link', '')}"
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def _published_date(entry: Any) -> Optional[datetime]:
+    """Parse various date formats from RSS entries"""
+    date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
+    
+    for field in date_fields:
+        if hasattr(entry, field) and getattr(entry, field):
+            try:
+                # feedparser's *_parsed fields are UTC struct_times
+                time_struct = getattr(entry, field)
+                return datetime.fromtimestamp(calendar.timegm(time_struct), tz=timezone.utc)
+            except:
+                continue
+    
+    # Try parsing string dates
+    date_strings = ['published', 'updated', 'created']
+    for field in date_strings:
+        if hasattr(entry, field) and getattr(entry, field):
+            try:
+                published = _parse_date_string(getattr(entry, field))
+            except:
+                continue
+            # Like feedparser, read dates without an offset as UTC
+            return published if published.tzinfo else published.replace(tzinfo=timezone.utc)
+    
+    return None
+
+
+def _parse_date_string(value: str) -> datetime:
+    """Parse an Atom (ISO 8601) or RSS (RFC 822) date string"""
+    try:
+        return _parse_iso_datetime(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        # Anything else goes to dateutil's slower, more forgiving parser
+        return date_parser.parse(value)
+
+
+def _rss_entries(feed_data: bytes) -> Optional[List[feedparser.FeedParserDict]]:
+    """Read the items of a plain RSS 2.0 feed with lxml's streaming parser.
+    
+    Returns entries holding the title, link, summary and published text that
+    feedparser would report for the same items, so entry ids do not change.
+    Returns None for anything where the two could differ (Atom, RDF, a DOCTYPE,
+    markup inside fields, items without exactly one <link>, content:encoded
+    without a description, malformed XML) so the caller uses feedparser.
+    """
+    if etree is None or b'<!DOCTYPE' in feed_data[:1024].upper():
+        return None
+
+    entries: List[feedparser.FeedParserDict] = []
+    try:
+        context = etree.iterparse(
+            io.BytesIO(feed_data), events=('end',), tag='item',
+            resolve_entities=False, no_network=True
+        )
+        for _, item in context:
+            titles = item.findall('title')
+            links = item.findall('link')
+            descriptions = item.findall('description')
+            if (len(titles) > 1 or len(links) != 1 or len(descriptions) > 1
+                    or any(len(field) for field in titles + links + descriptions)
+                    or (not descriptions and item.find(_CONTENT_ENCODED_TAG) is not None)):
+                return None
+
+            entry = feedparser.FeedParserDict(link=(links[0].text or '').strip())
+            if titles:
+                entry['title'] = (titles[0].text or '').strip()
+            if descriptions:
+                entry['summary'] = (descriptions[0].text or '').strip()
+            published = item.findtext('pubDate') or item.findtext(_DC_DATE_TAG)
+            if published:
+                entry['published'] = published.strip()
+            entries.append(entry)
+
+            # Drop parsed items so memory stays flat on long feeds
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+    except etree.LxmlError:
+        return None
+
+    if context.root is None or context.root.tag != 'rss':
+        return None
+    return entries
+
+
+# Parsed entries as parallel columns: ids, titles, links, summaries, published
+# dates and legacy MD5 ids (None unless requested). Lists of strings pickle far
+# smaller than lists of objects on the way back from a parse worker, and only
+# the entries that survive the seen-check are turned into Articles.
+FeedColumns = Tuple[List[str], List[str], List[str], List[str],
+                    List[Optional[datetime]], List[Optional[str]]]
+
+
+def _parse_feed(feed_data: bytes, feed_name: str,
+                keywords: Optional[List[str]] = None,
+                legacy_ids: bool = False,
+                max_items: Optional[int] = None) -> FeedColumns:
+    """Parse raw feed data into columns of recent, keyword-matching entries.
+    
+    Runs in a parse worker process, so it only uses its arguments; the parent
+    checks the ids against seen entries before building articles. Processing
+    stops after max_items matching entries, but only while every entry so far
+    is dated and no newer than the one before it; an undated or out-of-order
+    entry disables the cap, so oldest-first feeds are read to the end.
+    Errors propagate, so callers can tell a failed parse from an empty feed.
+    """
+    ids: List[str] = []
+    titles: List[str] = []
+    links: List[str] = []
+    summaries: List[str] = []
+    published_dates: List[Optional[datetime]] = []
+    legacy: List[Optional[str]] = []
+
+    entries = _rss_entries(feed_data)
+    if entries is None:
+        # Summaries are reduced to plain text by _strip_html, so skip feedparser's
+        # HTML sanitizer and relative-URI rewriting of entry content
+        feed = feedparser.parse(feed_data, sanitize_html=False, resolve_relative_uris=False)
+
+        if feed.bozo:
+            logger.warning(f"Feed parsing issue for {feed_name}: {feed.bozo_exception}")
+        entries = feed.entries
+
+    # Set a reasonable cutoff time (30 days) to avoid fetching very old articles
+    cutoff_time = datetime.now(timezone.utc) - timedelta(days=30)
+    matches_keyword = _keyword_matcher(tuple(keywords)) if keywords else None
+    # The cap assumes newest-first order; stays set only while that holds
+    newest_first = bool(max_items)
+    previous_published: Optional[datetime] = None
+
+    for entry in entries:
+        # Extract entry data
+        title = entry.get('title', 'No title')
+        summary = entry.get('summary', entry.get('description', ''))
+        published = _published_date(entry)
+        
+        if newest_first:
+            if published is None or (previous_published and published > previous_published):
+                newest_first = False
+            previous_published = published
+
+        # Skip very old articles (older than 30 days)
+        if published and published < cutoff_time:
+            continue
+
+        # Filter by keywords if provided
+        if matches_keyword and not matches_keyword(f"{title} {summary}"):
+            continue
+        
+        # Clean summary
+        if summary:
+            # Remove HTML tags
+            summary = _strip_html(summary)
+            # Limit length
+            if len(summary) > 500:
+                summary = summary[:497] + "..."
+        
+        ids.append(_entry_id(entry))
+        titles.append(title)
+        links.append(entry.get('link', ''))
+        summaries.append(summary)
+        published_dates.append(published)
+        legacy.append(_legacy_entry_id(entry) if legacy_ids else None)
+        if newest_first and len(ids) >= max_items:
+            break
+    
+    return ids, titles, links, summaries, published_dates, legacy
+
+
+@lru_cache(maxsize=8)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Build a case-insensitive test for whether text contains any of the keywords"""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    
+    # One alternation (RE2 when installed) rather than a scan per keyword
+    pattern = _keyword_re.compile('(?i)' + '|'.join(_keyword_re.escape(keyword) for keyword in keywords))
+    return lambda text: pattern.search(text) is not None
+
 
 class AsyncRSSParser:
     def __init__(self, cache_file: str = "feed_cache.json", config_file: str = "config.yaml"):
         self.cache_file: str = cache_file
         self.config_file: str = config_file
         self.config: Dict[str, Any] = self._load_config()
-        self.seen_entries: Dict[str, datetime] = self._load_cache()
+        self.cache_log_file: str = f"{cache_file}.log"
+        # Log lines for entries seen since the last flush
+        self._pending_cache_lines: List[str] = []
+        # Entry id -> epoch seconds when first seen, least recently seen first
+        self.seen_entries: OrderedDict[str, float] = self._load_cache()
+        # Ids cached before entry ids switched from MD5 (32 hex chars) to BLAKE2b
+        self._legacy_seen_ids: Set[str] = {k for k in self.seen_entries if len(k) == 32}
         # Initialize circuit breakers per domain
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        # Feed URL -> (ETag, Last-Modified) of the last version processed with the cache
+        self._feed_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # Keywords the stored validators were processed with; new keywords need full fetches
+        self._validator_keywords: Tuple[str, ...] = ()
+        # Shared HTTP session, created lazily on the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Parse worker processes, started lazily on the first feed parse
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         try:
-            with open(self.config_file, 'r') as f:
-                return yaml.safe_load(f)
+            path = os.path.abspath(self.config_file)
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(path)
+            if cached is None or cached[0] != mtime_ns:
+                with open(path, 'r') as f:
+                    cached = (mtime_ns, yaml.load(f, Loader=_YamlLoader))
+                _CONFIG_CACHE[path] = cached
+            # Each parser gets its own copy, since callers may modify their config
+            return copy.deepcopy(cached[1])
         except Exception as e:
             logger.error(f"Error loading config file: {e}")
             # Fall back to default config
@@ -43,68 +341,97 @@ class AsyncRSSParser:
                 'rss_fetch': {
                     'timeout': 30,
                     'max_retries': 3,
-                    'retry_delay': 5
+                    'retry_delay': 5,
+                    'max_concurrent_feeds': 10,
+                    'max_items_per_feed': 50
                 }
             }
     
-    def _load_cache(self) -> Dict[str, datetime]:
-        """Load previously seen entries from cache"""
+    def _load_cache(self) -> OrderedDict[str, float]:
+        """Load previously seen entries from the cache snapshot and its log"""
+        seen_entries: OrderedDict[str, float] = OrderedDict()
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    # Convert string dates back to datetime objects
-                    return {
-                        k: datetime.fromisoformat(v) 
-                        for k, v in cache_data.items()
-                    }
+                with open(self.cache_file, 'rb') as f:
+                    cache_data = orjson.loads(f.read()) if orjson else json.load(f)
+                # Older snapshots store ISO dates rather than epoch seconds
+                seen_entries = OrderedDict(
+                    (k, datetime.fromisoformat(v).timestamp() if isinstance(v, str) else v)
+                    for k, v in cache_data.items()
+                )
             except Exception as e:
                 logger.error(f"Error loading cache: {e}")
-        return {}
+        
+        if os.path.exists(self.cache_log_file):
+            try:
+                with open(self.cache_log_file, 'r') as f:
+                    for line in f:
+                        entry_id, _, seen_at = line.partition('\t')
+                        try:
+                            seen_entries[entry_id] = float(seen_at)
+                        except ValueError:
+                            continue  # Line cut short by a crash mid-write
+                        seen_entries.move_to_end(entry_id)
+            except Exception as e:
+                logger.error(f"Error loading cache log: {e}")
+        
+        while len(seen_entries) > _SEEN_ENTRIES_MAX:
+            seen_entries.popitem(last=False)
+        return seen_entries
     
-    def _save_cache(self) -> None:
-        """Save seen entries to cache"""
+    def _flush_cache(self) -> None:
+        """Append entries seen since the last flush to the cache log"""
+        if not self._pending_cache_lines:
+            return
+        lines, self._pending_cache_lines = self._pending_cache_lines, []
         try:
-            cache_data = {
-                k: v.isoformat() 
-                for k, v in self.seen_entries.items()
-            }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            with FileLockManager().get_lock(self.cache_log_file):
+                with open(self.cache_log_file, 'a') as f:
+                    f.writelines(lines)
+            if os.path.getsize(self.cache_log_file) > _CACHE_LOG_MAX_BYTES:
+                self._compact_cache()
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
     
+    def _compact_cache(self) -> None:
+        """Rewrite the cache snapshot from memory and empty the log"""
+        try:
+            with FileLockManager().get_lock(self.cache_log_file):
+                tmp_file = f"{self.cache_file}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    if orjson:
+                        f.write(orjson.dumps(self.seen_entries))
+                    else:
+                        f.write(json.dumps(self.seen_entries).encode())
+                os.replace(tmp_file, self.cache_file)
+                # Every logged entry is now in the snapshot
+                open(self.cache_log_file, 'w').close()
+        except Exception as e:
+            logger.error(f"Error compacting cache: {e}")
+    
     def _generate_entry_id(self, entry: Dict[str, Any]) -> str:
         """Generate unique ID for an entry"""
-        # Use combination of title and link for uniqueness
-        content = f"{entry.get('title', '')}{entry.get('link', '')}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return _entry_id(entry)
+    
+    def _adopt_legacy_id(self, legacy_id: str, entry_id: str) -> bool:
+        """Re-key an entry cached under its old MD5 id; True if it was seen before"""
+        if legacy_id not in self._legacy_seen_ids:
+            return False
+        self._legacy_seen_ids.discard(legacy_id)
+        self._mark_seen(entry_id, self.seen_entries.pop(legacy_id, time.time()))
+        return True
+    
+    def _mark_seen(self, entry_id: str, seen_at: float) -> None:
+        """Record a new entry as seen, dropping the least recently seen past the cap"""
+        self.seen_entries[entry_id] = seen_at
+        self._pending_cache_lines.append(f"{entry_id}\t{seen_at}\n")
+        if len(self.seen_entries) > _SEEN_ENTRIES_MAX:
+            evicted_id, _ = self.seen_entries.popitem(last=False)
+            self._legacy_seen_ids.discard(evicted_id)
     
     def _parse_published_date(self, entry: Any) -> Optional[datetime]:
         """Parse various date formats from RSS entries"""
-        date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
-        
-        for field in date_fields:
-            if hasattr(entry, field) and getattr(entry, field):
-                try:
-                    time_struct = getattr(entry, field)
-                    return datetime.fromtimestamp(
-                        feedparser._parse_date(time_struct), 
-                        tz=timezone.utc
-                    )
-                except:
-                    continue
-        
-        # Try parsing string dates
-        date_strings = ['published', 'updated', 'created']
-        for field in date_strings:
-            if hasattr(entry, field) and getattr(entry, field):
-                try:
-                    return date_parser.parse(getattr(entry, field))
-                except:
-                    continue
-        
-        return None
+        return _published_date(entry)
     
     def _get_circuit_breaker(self, url: str) -> CircuitBreaker:
         """Get or create circuit breaker for a domain."""
@@ -121,14 +448,28 @@ class AsyncRSSParser:
         return self.circuit_breakers[domain]
 
     async def _fetch_feed_with_retry(self, session: aiohttp.ClientSession,
-                                   feed_url: str, feed_name: str) -> Optional[bytes]:
-        """Fetch RSS feed with retry logic and circuit breaker."""
+                                   feed_url: str, feed_name: str,
+                                   conditional: bool = False
+                                   ) -> Optional[Tuple[bytes, Tuple[Optional[str], Optional[str]]]]:
+        """Fetch RSS feed with retry logic and circuit breaker.
+        
+        Returns the body with the response's (ETag, Last-Modified); the caller
+        stores those once the entries are processed. With conditional set, the
+        feed is requested with the stored validators and None is returned if the
+        server says it is unchanged.
+        """
         fetch_config = self.config.get('rss_fetch', {})
         timeout = fetch_config.get('timeout', 30)
         max_retries = fetch_config.get('max_retries', 3)
         retry_delay = fetch_config.get('retry_delay', 5)
 
         headers = {'User-Agent': 'SlackWire RSS Bot 1.0'}
+        if conditional and feed_url in self._feed_validators:
+            etag, last_modified = self._feed_validators[feed_url]
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
         circuit_breaker = self._get_circuit_breaker(feed_url)
 
         for attempt in range(max_retries):
@@ -145,7 +486,15 @@ class AsyncRSSParser:
                                      timeout=aiohttp.ClientTimeout(total=timeout)) as response:
                     if response.status == 200:
                         circuit_breaker.record_success()
-                        return await response.read()
+                        validators = (
+                            response.headers.get('ETag'),
+                            response.headers.get('Last-Modified')
+                        )
+                        return await response.read(), validators
+                    elif response.status == 304:
+                        circuit_breaker.record_success()
+                        logger.info(f"Feed unchanged since last fetch: {feed_name}")
+                        return None
                     else:
                         raise aiohttp.ClientResponseError(
                             request_info=response.request_info,
@@ -192,69 +541,88 @@ class AsyncRSSParser:
                             category: str, keywords: Optional[List[str]] = None,
                             use_cache: bool = True) -> List[Article]:
         """Process feed entries from raw data"""
-        new_entries: List[Article] = []
-
         try:
-            feed = feedparser.parse(feed_data)
-
-            if feed.bozo:
-                logger.warning(f"Feed parsing issue for {feed_name}: {feed.bozo_exception}")
-
-            # Set a reasonable cutoff time (30 days) to avoid fetching very old articles
-            cutoff_time = datetime.now(timezone.utc) - timedelta(days=30)
-
-            for entry in feed.entries:
-                entry_id = self._generate_entry_id(entry)
-
-                # Skip if we've seen this entry (when using cache)
-                if use_cache and entry_id in self.seen_entries:
-                    continue
-
-                # Extract entry data
-                title = entry.get('title', 'No title')
-                link = entry.get('link', '')
-                summary = entry.get('summary', entry.get('description', ''))
-                published = self._parse_published_date(entry)
-
-                # Skip very old articles (older than 30 days)
-                if published and published < cutoff_time:
-                    continue
-
-                # Filter by keywords if provided
-                if keywords:
-                    content = f"{title} {summary}".lower()
-                    if not any(keyword.lower() in content for keyword in keywords):
-                        continue
-                
-                # Clean summary
-                if summary:
-                    # Remove HTML tags
-                    summary = BeautifulSoup(summary, 'html.parser').get_text()
-                    # Limit length
-                    if len(summary) > 500:
-                        summary = summary[:497] + "..."
-                
-                new_article = Article(
-                    id=entry_id,
-                    title=title,
-                    link=link,
-                    summary=summary,
-                    published=published,
-                    feed_name=feed_name,
-                    category=FeedCategory(category) if category in [e.value for e in FeedCategory] else FeedCategory.GENERAL
-                )
-
-                new_entries.append(new_article)
-                if use_cache:
-                    self.seen_entries[entry_id] = datetime.now(timezone.utc)
-            
-            logger.info(f"Found {len(new_entries)} new entries from {feed_name}")
-            
+            columns = _parse_feed(
+                feed_data, feed_name, keywords,
+                use_cache and bool(self._legacy_seen_ids),
+                self.config.get('rss_fetch', {}).get('max_items_per_feed', 50)
+            )
         except Exception as e:
             logger.error(f"Error processing feed {feed_name}: {e}", exc_info=True)
+            return []
+        return self._filter_seen(feed_name, category, columns, use_cache)
+    
+    def _filter_seen(self, feed_name: str, category: str, columns: FeedColumns,
+                     use_cache: bool) -> List[Article]:
+        """Drop entries seen before (when using cache), record the rest as seen and build their articles"""
+        ids, titles, links, summaries, published_dates, legacy_ids = columns
+        if not use_cache:
+            keep = range(len(ids))
+        else:
+            keep = []
+            for i, entry_id in enumerate(ids):
+                if entry_id in self.seen_entries:
+                    # Still in its feed, so keep it clear of eviction
+                    self.seen_entries.move_to_end(entry_id)
+                    continue
+                legacy_id = legacy_ids[i]
+                if legacy_id and self._adopt_legacy_id(legacy_id, entry_id):
+                    continue
+                keep.append(i)
+                self._mark_seen(entry_id, time.time())
+        
+        feed_category = _CATEGORY_BY_VALUE.get(category, FeedCategory.GENERAL)
+        new_entries = [
+            Article(
+                id=ids[i],
+                title=titles[i],
+                link=links[i],
+                summary=summaries[i],
+                published=published_dates[i],
+                feed_name=feed_name,
+                category=feed_category
+            )
+            for i in keep
+        ]
         
+        logger.info(f"Found {len(new_entries)} new entries from {feed_name}")
         return new_entries
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session so connections and DNS lookups are reused"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the parse worker pool, starting it on first use"""
+        if self._parse_pool is None:
+            # feedparser and HTML stripping are CPU-bound and hold the GIL; parse
+            # in worker processes so feeds are processed in parallel, off the event loop
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=int(os.getenv('FEED_WORKERS', os.cpu_count() or 4)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=setup_worker_logging
+            )
+        return self._parse_pool
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and the parse workers, and compact the cache"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False)
+            self._parse_pool = None
+        self._flush_cache()
+        if os.path.exists(self.cache_log_file) and os.path.getsize(self.cache_log_file):
+            self._compact_cache()
+    
     async def parse_feed_async(self, session: aiohttp.ClientSession,
                               feed_dict: Dict[str, Any], keywords: Optional[List[str]] = None,
                               use_cache: bool = True) -> List[Article]:
@@ -263,17 +631,35 @@ class AsyncRSSParser:
         feed_name = feed_dict['name']
         category = feed_dict.get('category', 'general')
         
-        feed_data = await self._fetch_feed_with_retry(session, feed_url, feed_name)
-        if not feed_data:
+        if use_cache and tuple(keywords or ()) != self._validator_keywords:
+            # A 304 only means nothing changed for the keywords last used
+            self._feed_validators.clear()
+            self._validator_keywords = tuple(keywords or ())
+        
+        # Skip unchanged feeds, unless every current entry is wanted regardless of cache
+        fetched = await self._fetch_feed_with_retry(
+            session, feed_url, feed_name, conditional=use_cache
+        )
+        if not fetched:
             return []
+        feed_data, validators = fetched
         
-        return self._process_feed_entries(
-            feed_data, feed_url, feed_name, category, keywords, use_cache
+        loop = asyncio.get_running_loop()
+        columns = await loop.run_in_executor(
+            self._get_parse_pool(), _parse_feed,
+            feed_data, feed_name, keywords,
+            use_cache and bool(self._legacy_seen_ids),
+            self.config.get('rss_fetch', {}).get('max_items_per_feed', 50)
         )
+        new_entries = self._filter_seen(feed_name, category, columns, use_cache)
+        if use_cache:
+            # Only now is this version processed; until here a failure leaves it to be refetched
+            self._feed_validators[feed_url] = validators
+        return new_entries
     
     async def parse_multiple_feeds_async(self, keywords: Optional[List[str]] = None,
                                        use_cache: bool = True) -> List[Article]:
-        """Parse multiple RSS feeds concurrently"""
+        """Parse multiple RSS feeds concurrently, returning articles newest first"""
         feeds: List[Dict[str, Any]] = self.config.get('rss_feeds', [])
         if not feeds:
             logger.warning("No feeds configured in config.yaml")
@@ -281,33 +667,31 @@ class AsyncRSSParser:
 
         all_entries: List[Article] = []
         
-        # Create connection pool with reasonable limits
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=2)
+        session = self._get_session()
         
-        async with aiohttp.ClientSession(connector=connector) as session:
-            # Create tasks for all feeds
-            tasks = [
-                self.parse_feed_async(session, feed, keywords, use_cache)
-                for feed in feeds
-            ]
-            
-            # Execute all tasks concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error parsing feed {feeds[i]['name']}: {result}")
-                else:
-                    all_entries.extend(result)
+        # Bound the feeds in flight so only their raw bytes are held at once
+        max_concurrent = self.config.get('rss_fetch', {}).get('max_concurrent_feeds', 10)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def parse_bounded(feed: Dict[str, Any]) -> List[Article]:
+            async with semaphore:
+                try:
+                    return await self.parse_feed_async(session, feed, keywords, use_cache)
+                except Exception as e:
+                    logger.error(f"Error parsing feed {feed['name']}: {e}")
+                    return []
+        
+        # Collect each feed's entries as it finishes rather than waiting for the slowest
+        for next_result in asyncio.as_completed([parse_bounded(feed) for feed in feeds]):
+            all_entries.extend(await next_result)
         
-        # Save cache after processing all feeds
+        # Record newly seen entries after processing all feeds
         if use_cache:
-            self._save_cache()
+            self._flush_cache()
         
         # Sort by published date (newest first)
         all_entries.sort(
-            key=lambda x: x.published or datetime.min.replace(tzinfo=timezone.utc),
+            key=attrgetter('sort_ts'),
             reverse=True
         )
         
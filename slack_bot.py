@@ -1,20 +1,134 @@
 import os
+import copy
 import logging
-from typing import List, Dict, Optional
-from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
+from typing import List, Dict, Optional, Tuple
+import aiohttp
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from datetime import datetime
+from functools import lru_cache
 import json
 from config_manager import ConfigManager
 from feedback_manager import FeedbackManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj) -> str:
+    """Serialize Slack API request bodies, with orjson when available"""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+@lru_cache(maxsize=1024)
+def _article_blocks(article_id: Optional[str], title: str, link: str, summary: Optional[str],
+                    ai_summary: Optional[str], feed_name: Optional[str], category: Optional[str],
+                    published: Optional[datetime], include_feedback: bool) -> Tuple[Dict, ...]:
+    """Build an article's title, summary, metadata and feedback button blocks.
+    
+    Cached on every field that appears in the output, so an article reposted by the
+    digest or /ai-news-latest reuses its blocks. The cached blocks are shared, so
+    callers get copies through format_article_block.
+    """
+    blocks = [
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*<{link}|{title}>*"
+            }
+        }
+    ]
+    
+    # Add AI summary if available, otherwise use original summary
+    if ai_summary:
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"🤖 *AI Summary:* {ai_summary}"
+            }
+        })
+    elif summary:
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": summary
+            }
+        })
+    
+    # Add metadata
+    metadata_parts = []
+    if feed_name:
+        metadata_parts.append(f"*Source:* {feed_name}")
+    if category:
+        metadata_parts.append(f"*Category:* {category}")
+    if published:
+        pub_date = published.strftime("%Y-%m-%d %H:%M UTC")
+        metadata_parts.append(f"*Published:* {pub_date}")
+    
+    if metadata_parts:
+        blocks.append({
+            "type": "context",
+            "elements": [{
+                "type": "mrkdwn",
+                "text": " | ".join(metadata_parts)
+            }]
+        })
+    
+    # Add feedback buttons if requested
+    if include_feedback and article_id:
+        # Prepare article data for feedback tracking
+        feedback_value = json.dumps({
+            'id': article_id,
+            'title': title or '',
+            'feed_name': feed_name or '',
+            'category': category or ''
+        })
+        
+        blocks.append({
+            "type": "actions",
+            "block_id": f"article_feedback_{article_id[:8]}",
+            "elements": [
+                {
+                    "type": "button",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "👍 Interesting",
+                        "emoji": True
+                    },
+                    "value": feedback_value,
+                    "action_id": "article_interesting",
+                    "style": "primary"
+                },
+                {
+                    "type": "button",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "👎 Not Relevant",
+                        "emoji": True
+                    },
+                    "value": feedback_value,
+                    "action_id": "article_not_relevant"
+                }
+            ]
+        })
+    
+    return tuple(blocks)
+
+
 class AINewsSlackBot:
     def __init__(self, bot_token: str, app_token: str, channel_id: str):
-        self.app = App(token=bot_token)
+        self.app = AsyncApp(token=bot_token)
         self.app_token = app_token
+        self.handler: Optional[AsyncSocketModeHandler] = None
         self.channel_id = channel_id
         
         # Initialize managers
@@ -28,42 +142,42 @@ class AINewsSlackBot:
         """Register Slack event handlers"""
         
         @self.app.event("app_mention")
-        def handle_mention(event, say):
+        async def handle_mention(event, say):
             """Handle when the bot is mentioned"""
-            say(
+            await say(
                 text="Hi! I'm the AI News Bot. I monitor RSS feeds from top AI labs and news sources to keep you updated on the latest in AI.",
                 thread_ts=event.get("ts")
             )
         
         @self.app.command("/ai-news-status")
-        def handle_status_command(ack, command, respond):
+        async def handle_status_command(ack, command, respond):
             """Handle status check command"""
-            ack()
-            respond("AI News Bot is running and monitoring feeds!")
+            await ack()
+            await respond("AI News Bot is running and monitoring feeds!")
         
         @self.app.command("/ai-news-latest")
-        def handle_latest_command(ack, command, respond):
+        async def handle_latest_command(ack, command, respond):
             """Handle request for latest articles"""
-            ack()
+            await ack()
             # This will be populated by the main bot
             if hasattr(self, 'get_latest_callback') and self.get_latest_callback:
-                self.get_latest_callback(respond)
+                await self.get_latest_callback(respond)
             else:
-                respond("⚠️ Latest articles feature is initializing. Please try again in a moment.")
+                await respond("⚠️ Latest articles feature is initializing. Please try again in a moment.")
         
         @self.app.command("/ai-news-add-feed")
-        def handle_add_feed(ack, command, respond):
+        async def handle_add_feed(ack, command, respond):
             """Add a new RSS feed"""
-            ack()
+            await ack()
             text = command.get('text', '').strip()
             
             if not text:
-                respond("❌ Usage: `/ai-news-add-feed <url> <name> [category]`\nExample: `/ai-news-add-feed https://example.com/feed.xml ExampleAI company`")
+                await respond("❌ Usage: `/ai-news-add-feed <url> <name> [category]`\nExample: `/ai-news-add-feed https://example.com/feed.xml ExampleAI company`")
                 return
             
             parts = text.split(maxsplit=2)
             if len(parts) < 2:
-                respond("❌ Please provide both URL and name. Usage: `/ai-news-add-feed <url> <name> [category]`")
+                await respond("❌ Please provide both URL and name. Usage: `/ai-news-add-feed <url> <name> [category]`")
                 return
             
             url = parts[0]
@@ -72,38 +186,38 @@ class AINewsSlackBot:
             
             success, message = self.config_manager.add_feed(url, name, category)
             if success:
-                respond(f"✅ {message}")
+                await respond(f"✅ {message}")
                 if hasattr(self, 'reload_config_callback') and self.reload_config_callback:
-                    self.reload_config_callback()
+                    await self.reload_config_callback()
             else:
-                respond(f"❌ {message}")
+                await respond(f"❌ {message}")
         
         @self.app.command("/ai-news-remove-feed")
-        def handle_remove_feed(ack, command, respond):
+        async def handle_remove_feed(ack, command, respond):
             """Remove an RSS feed"""
-            ack()
+            await ack()
             name = command.get('text', '').strip()
             
             if not name:
-                respond("❌ Usage: `/ai-news-remove-feed <name>`")
+                await respond("❌ Usage: `/ai-news-remove-feed <name>`")
                 return
             
             success, message = self.config_manager.remove_feed(name)
             if success:
-                respond(f"✅ {message}")
+                await respond(f"✅ {message}")
                 if hasattr(self, 'reload_config_callback') and self.reload_config_callback:
-                    self.reload_config_callback()
+                    await self.reload_config_callback()
             else:
-                respond(f"❌ {message}")
+                await respond(f"❌ {message}")
         
         @self.app.command("/ai-news-list-feeds")
-        def handle_list_feeds(ack, command, respond):
+        async def handle_list_feeds(ack, command, respond):
             """List all configured feeds"""
-            ack()
+            await ack()
             feeds = self.config_manager.list_feeds()
             
             if not feeds:
-                respond("📭 No feeds configured yet.")
+                await respond("📭 No feeds configured yet.")
                 return
             
             blocks = [
@@ -144,89 +258,89 @@ class AINewsSlackBot:
             if blocks[-1].get("type") == "divider":
                 blocks.pop()
             
-            respond(blocks=blocks, text=f"Found {len(feeds)} configured feeds")
+            await respond(blocks=blocks, text=f"Found {len(feeds)} configured feeds")
         
         @self.app.command("/ai-news-add-keyword")
-        def handle_add_keyword(ack, command, respond):
+        async def handle_add_keyword(ack, command, respond):
             """Add a new keyword"""
-            ack()
+            await ack()
             keyword = command.get('text', '').strip()
             
             if not keyword:
-                respond("❌ Usage: `/ai-news-add-keyword <keyword>`")
+                await respond("❌ Usage: `/ai-news-add-keyword <keyword>`")
                 return
             
             success, message = self.config_manager.add_keyword(keyword)
             if success:
-                respond(f"✅ {message}")
+                await respond(f"✅ {message}")
                 if hasattr(self, 'reload_config_callback') and self.reload_config_callback:
-                    self.reload_config_callback()
+                    await self.reload_config_callback()
             else:
-                respond(f"❌ {message}")
+                await respond(f"❌ {message}")
         
         @self.app.command("/ai-news-remove-keyword")
-        def handle_remove_keyword(ack, command, respond):
+        async def handle_remove_keyword(ack, command, respond):
             """Remove a keyword"""
-            ack()
+            await ack()
             keyword = command.get('text', '').strip()
             
             if not keyword:
-                respond("❌ Usage: `/ai-news-remove-keyword <keyword>`")
+                await respond("❌ Usage: `/ai-news-remove-keyword <keyword>`")
                 return
             
             success, message = self.config_manager.remove_keyword(keyword)
             if success:
-                respond(f"✅ {message}")
+                await respond(f"✅ {message}")
                 if hasattr(self, 'reload_config_callback') and self.reload_config_callback:
-                    self.reload_config_callback()
+                    await self.reload_config_callback()
             else:
-                respond(f"❌ {message}")
+                await respond(f"❌ {message}")
         
         @self.app.command("/ai-news-list-keywords")
-        def handle_list_keywords(ack, command, respond):
+        async def handle_list_keywords(ack, command, respond):
             """List all configured keywords"""
-            ack()
+            await ack()
             keywords = self.config_manager.list_keywords()
             
             if not keywords:
-                respond("📭 No keywords configured yet.")
+                await respond("📭 No keywords configured yet.")
                 return
             
             keywords_text = "\n".join([f"• {keyword}" for keyword in sorted(keywords)])
-            respond(f"🔍 *AI Keywords ({len(keywords)} total):*\n{keywords_text}")
+            await respond(f"🔍 *AI Keywords ({len(keywords)} total):*\n{keywords_text}")
         
         @self.app.command("/ai-news-digest")
-        def handle_digest_command(ack, command, respond):
+        async def handle_digest_command(ack, command, respond):
             """Handle digest configuration"""
-            ack()
+            await ack()
             text = command.get('text', '').strip().lower()
             
             if text not in ['daily', 'weekly', 'off']:
-                respond("❌ Usage: `/ai-news-digest <daily|weekly|off>`")
+                await respond("❌ Usage: `/ai-news-digest <daily|weekly|off>`")
                 return
             
             # Update digest configuration
             if hasattr(self, 'set_digest_callback') and self.set_digest_callback:
-                self.set_digest_callback(text)
+                await self.set_digest_callback(text)
                 
             if text == 'off':
-                respond("📅 Digest notifications have been turned off.")
+                await respond("📅 Digest notifications have been turned off.")
             else:
-                respond(f"📅 Digest mode set to: {text}. You'll receive a summary {text} at 09:00 UTC.")
+                await respond(f"📅 Digest mode set to: {text}. You'll receive a summary {text} at 09:00 UTC.")
         
         @self.app.action("article_interesting")
-        def handle_interesting(ack, body, client):
+        async def handle_interesting(ack, body, client):
             """Handle 'interesting' button click"""
-            ack()
-            self._handle_article_feedback(body, client, "interesting")
+            await ack()
+            await self._handle_article_feedback(body, client, "interesting")
         
         @self.app.action("article_not_relevant")
-        def handle_not_relevant(ack, body, client):
+        async def handle_not_relevant(ack, body, client):
             """Handle 'not relevant' button click"""
-            ack()
-            self._handle_article_feedback(body, client, "not_relevant")
+            await ack()
+            await self._handle_article_feedback(body, client, "not_relevant")
     
-    def _handle_article_feedback(self, body, client, feedback_type: str):
+    async def _handle_article_feedback(self, body, client, feedback_type: str):
         """Process article feedback"""
         try:
             # Extract data
@@ -263,7 +377,7 @@ class AINewsSlackBot:
                     break
             
             # Update the message
-            client.chat_update(
+            await client.chat_update(
                 channel=body["channel"]["id"],
                 ts=body["message"]["ts"],
                 blocks=blocks
@@ -271,7 +385,7 @@ class AINewsSlackBot:
             
             # Send ephemeral confirmation
             emoji = "👍" if feedback_type == "interesting" else "👎"
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=body["channel"]["id"],
                 user=user,
                 text=f"{emoji} Thanks for your feedback!"
@@ -282,92 +396,26 @@ class AINewsSlackBot:
     
     def format_article_block(self, article: Dict, include_feedback: bool = True) -> List[Dict]:
         """Format article as Slack block"""
-        blocks = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*<{article['link']}|{article['title']}>*"
-                }
-            }
-        ]
+        published = article.get('published')
+        if isinstance(published, str):
+            # Article.to_dict() serializes the date
+            published = datetime.fromisoformat(published)
         
-        # Add AI summary if available, otherwise use original summary
-        if article.get('ai_summary'):
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"🤖 *AI Summary:* {article['ai_summary']}"
-                }
-            })
-        elif article.get('summary'):
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": article['summary']
-                }
-            })
-        
-        # Add metadata
-        metadata_parts = []
-        if article.get('feed_name'):
-            metadata_parts.append(f"*Source:* {article['feed_name']}")
-        if article.get('category'):
-            metadata_parts.append(f"*Category:* {article['category']}")
-        if article.get('published'):
-            pub_date = article['published'].strftime("%Y-%m-%d %H:%M UTC")
-            metadata_parts.append(f"*Published:* {pub_date}")
+        # Deep copy, so callers editing a block cannot change the cached one
+        blocks = copy.deepcopy(list(_article_blocks(
+            article.get('id'),
+            article['title'],
+            article['link'],
+            article.get('summary'),
+            article.get('ai_summary'),
+            article.get('feed_name'),
+            article.get('category'),
+            published,
+            include_feedback
+        )))
         
-        if metadata_parts:
-            blocks.append({
-                "type": "context",
-                "elements": [{
-                    "type": "mrkdwn",
-                    "text": " | ".join(metadata_parts)
-                }]
-            })
-        
-        # Add feedback buttons if requested
+        # Feedback stats change between posts, so they are added outside the cache
         if include_feedback and article.get('id'):
-            # Prepare article data for feedback tracking
-            feedback_data = {
-                'id': article['id'],
-                'title': article.get('title', ''),
-                'feed_name': article.get('feed_name', ''),
-                'category': article.get('category', '')
-            }
-            
-            blocks.append({
-                "type": "actions",
-                "block_id": f"article_feedback_{article['id'][:8]}",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "👍 Interesting",
-                            "emoji": True
-                        },
-                        "value": json.dumps(feedback_data),
-                        "action_id": "article_interesting",
-                        "style": "primary"
-                    },
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "👎 Not Relevant",
-                            "emoji": True
-                        },
-                        "value": json.dumps(feedback_data),
-                        "action_id": "article_not_relevant"
-                    }
-                ]
-            })
-            
-            # Add feedback stats if available
             feedback_summary = self.feedback_manager.get_article_feedback_summary(article['id'])
             if any(feedback_summary.values()):
                 blocks.append({
@@ -383,7 +431,7 @@ class AINewsSlackBot:
         
         return blocks
     
-    def post_articles(self, articles: List[Dict], batch_size: int = 5):
+    async def post_articles(self, articles: List[Dict], batch_size: int = 5):
         """Post articles to Slack channel"""
         if not articles:
             logger.info("No new articles to post")
@@ -415,7 +463,7 @@ class AINewsSlackBot:
                     blocks.pop()
                 
                 # Post to Slack
-                self.app.client.chat_postMessage(
+                await self.app.client.chat_postMessage(
                     channel=self.channel_id,
                     blocks=blocks,
                     text=f"AI News: {len(batch)} new articles"
@@ -426,7 +474,7 @@ class AINewsSlackBot:
         except Exception as e:
             logger.error(f"Error posting to Slack: {e}")
     
-    def post_single_article(self, article: Dict):
+    async def post_single_article(self, article: Dict):
         """Post a single article immediately"""
         try:
             blocks = [
@@ -445,7 +493,7 @@ class AINewsSlackBot:
             if blocks[-1].get("type") == "divider":
                 blocks.pop()
             
-            self.app.client.chat_postMessage(
+            await self.app.client.chat_postMessage(
                 channel=self.channel_id,
                 blocks=blocks,
                 text=f"Breaking: {article['title']}"
@@ -456,8 +504,17 @@ class AINewsSlackBot:
         except Exception as e:
             logger.error(f"Error posting single article: {e}")
     
-    def start(self):
-        """Start the Slack bot in socket mode"""
-        handler = SocketModeHandler(self.app, self.app_token)
+    async def start_async(self):
+        """Start the Slack bot in socket mode on the running event loop"""
+        # One pooled session for all Web API calls; Bolt's per-request clients share it
+        self.app.client.session = aiohttp.ClientSession(json_serialize=_json_dumps)
+        self.handler = AsyncSocketModeHandler(self.app, self.app_token)
         logger.info("Starting Slack bot...")
-        handler.start()
\ No newline at end of file
+        await self.handler.start_async()
+    
+    async def stop_async(self):
+        """Disconnect socket mode and close the web API session"""
+        if self.handler:
+            await self.handler.close_async()
+        if self.app.client.session:
+            await self.app.client.session.close()
@@ -233,4 +233,26 @@ class TestCircuitBreaker:
         
         # Test with no failure time
         cb.last_failure_time = None
-        assert cb._get_recovery_time() == "unknown"
\ No newline at end of file
+        assert cb._get_recovery_time() == "unknown"
+    
+    @pytest.mark.asyncio
+    async def test_call_async_records_failures(self):
+        """Test that awaited calls open and then block the circuit"""
+        config = CircuitBreakerConfig(failure_threshold=1)
+        cb = CircuitBreaker(config)
+        
+        async def failing_func():
+            raise Exception("Test failure")
+        
+        async def ok_func():
+            return "ok"
+        
+        assert await cb.call_async(ok_func) == "ok"
+        
+        with pytest.raises(Exception, match="Test failure"):
+            await cb.call_async(failing_func)
+        
+        assert cb.state == CircuitState.OPEN
+        
+        with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+            await cb.call_async(ok_func)
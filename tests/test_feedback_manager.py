@@ -2,6 +2,7 @@ import pytest
 import os
 import json
 from datetime import datetime
+from unittest.mock import patch
 
 from feedback_manager import FeedbackManager
 
@@ -218,4 +219,75 @@ class TestFeedbackManager:
         manager2 = FeedbackManager(feedback_file=feedback_file)
         
         assert 'test123' in manager2.feedback_data['articles']
-        assert 'U12345' in manager2.feedback_data['user_preferences']
\ No newline at end of file
+        assert 'U12345' in manager2.feedback_data['user_preferences']
+    
+    def test_feedback_replayed_from_log(self, temp_dir):
+        """Test feedback is appended to the log and replayed on load"""
+        feedback_file = os.path.join(temp_dir, 'test_feedback.json')
+        
+        manager1 = FeedbackManager(feedback_file=feedback_file)
+        manager1.add_feedback('test123', 'U12345', 'interesting',
+                              {'feed_name': 'Test', 'category': 'test'})
+        
+        assert os.path.exists(manager1.log_file)
+        assert not os.path.exists(feedback_file)
+        
+        # New source for the same user after reload must not raise
+        manager2 = FeedbackManager(feedback_file=feedback_file)
+        manager2.add_feedback('test456', 'U12345', 'not_relevant',
+                              {'feed_name': 'Other', 'category': 'test'})
+        
+        user_prefs = manager2.feedback_data['user_preferences']['U12345']
+        assert user_prefs['total_feedback'] == 2
+        assert user_prefs['sources']['Other']['not_relevant'] == 1
+    
+    def test_compact_folds_log_into_snapshot(self, temp_dir):
+        """Test compaction writes the snapshot and truncates the log"""
+        feedback_file = os.path.join(temp_dir, 'test_feedback.json')
+        
+        manager = FeedbackManager(feedback_file=feedback_file)
+        manager.add_feedback('test123', 'U12345', 'interesting',
+                             {'feed_name': 'Test', 'category': 'test'})
+        manager.compact()
+        
+        with open(manager.log_file) as f:
+            assert not any('article_id' in line for line in f)
+        reloaded = FeedbackManager(feedback_file=feedback_file)
+        assert reloaded.feedback_data['source_scores']['Test']['interesting'] == 1
+    
+    def test_failed_compaction_keeps_log(self, temp_dir):
+        """Test a failed snapshot write leaves the log and any previous snapshot in place"""
+        feedback_file = os.path.join(temp_dir, 'test_feedback.json')
+        
+        manager = FeedbackManager(feedback_file=feedback_file)
+        manager.add_feedback('test123', 'U12345', 'interesting',
+                             {'feed_name': 'Test', 'category': 'test'})
+        
+        with patch('feedback_manager.json.dump', side_effect=OSError("disk full")):
+            assert manager.compact() is False
+        
+        with open(manager.log_file) as f:
+            assert any('test123' in line for line in f)
+        assert not os.path.exists(feedback_file)
+        reloaded = FeedbackManager(feedback_file=feedback_file)
+        assert reloaded.feedback_data['source_scores']['Test']['interesting'] == 1
+    
+    def test_crash_before_log_reset_does_not_double_count(self, temp_dir):
+        """Test a log already folded into the snapshot is not replayed on top of it"""
+        feedback_file = os.path.join(temp_dir, 'test_feedback.json')
+        
+        manager = FeedbackManager(feedback_file=feedback_file)
+        manager.add_feedback('test123', 'U12345', 'interesting',
+                             {'feed_name': 'Test', 'category': 'test'})
+        
+        with patch.object(FeedbackManager, '_reset_log', side_effect=OSError("crash")):
+            assert manager.compact() is True
+        
+        reloaded = FeedbackManager(feedback_file=feedback_file)
+        assert reloaded.feedback_data['source_scores']['Test']['interesting'] == 1
+        
+        # Feedback after the recovery is kept across the next restart
+        reloaded.add_feedback('test456', 'U12345', 'interesting',
+                              {'feed_name': 'Test', 'category': 'test'})
+        again = FeedbackManager(feedback_file=feedback_file)
+        assert again.feedback_data['source_scores']['Test']['interesting'] == 2
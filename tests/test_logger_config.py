@@ -0,0 +1,36 @@
+import pytest
+import json
+import logging
+
+import logger_config
+from logger_config import setup_logging
+
+
+@pytest.mark.unit
+class TestLoggerConfig:
+    def test_json_error_records_keep_exception_field(self, temp_dir, monkeypatch, capsys):
+        """Test that queued JSON records carry the traceback in 'exception', not in 'message'"""
+        monkeypatch.chdir(temp_dir)  # errors.log is created in the working directory
+        monkeypatch.setenv('ENVIRONMENT', 'production')
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+
+        try:
+            setup_logging(log_level='INFO', log_format='json')
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logging.getLogger('test').exception("Failed with %s", 'detail')
+            logger_config._listener.stop()
+        finally:
+            logger_config._listener = None
+            for handler in root_logger.handlers[:]:
+                root_logger.removeHandler(handler)
+            for handler in saved_handlers:
+                root_logger.addHandler(handler)
+            root_logger.setLevel(saved_level)
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line]
+        error = next(r for r in records if r['level'] == 'ERROR')
+        assert error['message'] == "Failed with detail"
+        assert 'ValueError: boom' in error['exception']
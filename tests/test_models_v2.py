@@ -0,0 +1,12 @@
+import pytest
+
+from models_v2 import AppConfig
+
+
+@pytest.mark.unit
+class TestAppConfig:
+    def test_clean_keywords_dedupes_in_configured_order(self):
+        """Test that keywords are cleaned and deduplicated without reordering"""
+        config = AppConfig(ai_keywords=['  LLM ', 'robotics', 'llm', '', 'AI', 'Robotics'])
+
+        assert config.ai_keywords == ['llm', 'robotics', 'ai']
@@ -2,12 +2,27 @@ import pytest
 import asyncio
 import aiohttp
 from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
+from email.utils import format_datetime
 import feedparser
+import hashlib
 
+import rss_parser
 from rss_parser import AsyncRSSParser
 
 
+def _dated_feed(hours_ago):
+    """Build an RSS feed with one item per entry of hours_ago, in that order"""
+    now = datetime.now(timezone.utc)
+    items = b''.join(
+        b'<item><title>AI %d</title><link>https://example.com/%d</link>'
+        b'<pubDate>%s</pubDate></item>'
+        % (i, i, format_datetime(now - timedelta(hours=h)).encode())
+        for i, h in enumerate(hours_ago)
+    )
+    return b'<rss version="2.0"><channel>' + items + b'</channel></rss>'
+
+
 @pytest.mark.unit
 class TestAsyncRSSParser:
     def test_init_loads_config(self, mock_config_file, mock_feed_cache):
@@ -32,7 +47,7 @@ class TestAsyncRSSParser:
         
         entry_id = parser._generate_entry_id(entry)
         assert isinstance(entry_id, str)
-        assert len(entry_id) == 32  # MD5 hex digest length
+        assert len(entry_id) == 16  # 8-byte BLAKE2b hex digest
         
         # Same entry should generate same ID
         entry_id2 = parser._generate_entry_id(entry)
@@ -81,7 +96,8 @@ class TestAsyncRSSParser:
             mock_session, 'https://example.com/feed.xml', 'Test Feed'
         )
         
-        assert result == b'<rss>test</rss>'
+        feed_data, _ = result
+        assert feed_data == b'<rss>test</rss>'
         mock_session.get.assert_called_once()
     
     @pytest.mark.asyncio
@@ -159,6 +175,123 @@ class TestAsyncRSSParser:
         entry_id = parser._generate_entry_id({'title': 'Test AI Article', 'link': 'https://example.com/article1'})
         assert entry_id in parser.seen_entries
     
+    def test_process_feed_entries_strips_unsanitized_markup(self, mock_config_file):
+        """Test that script contents never reach the summary now that feedparser skips sanitizing"""
+        parser = AsyncRSSParser(config_file=mock_config_file)
+
+        description = b'&lt;p&gt;Kept &amp;amp; shown&lt;script&gt;track()&lt;/script&gt;&lt;/p&gt;'
+        feed_data = b"""<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <item>
+                    <title>Scripted Article</title>
+                    <link>https://example.com/scripted</link>
+                    <description>%s</description>
+                </item>
+            </channel>
+        </rss>""" % description
+
+        entries = parser._process_feed_entries(
+            feed_data=feed_data,
+            feed_url='https://example.com/feed.xml',
+            feed_name='Test Feed',
+            category='test',
+            use_cache=False
+        )
+
+        assert entries[0].summary == 'Kept & shown'
+
+    def test_lxml_fast_path_matches_feedparser(self):
+        """Test that plain RSS read with lxml gives the same entries as feedparser"""
+        feed_data = b"""<?xml version="1.0" encoding="utf-8"?>
+        <rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+            <channel>
+                <item>
+                    <title>  AI &amp; ML &#8217;news  </title>
+                    <link>https://example.com/a?x=1&amp;y=2</link>
+                    <description><![CDATA[<p>About <b>machine learning</b></p>]]></description>
+                </item>
+                <item>
+                    <link>https://example.com/untitled</link>
+                    <dc:date>2099-01-01T00:00:00</dc:date>
+                </item>
+            </channel>
+        </rss>"""
+
+        assert rss_parser._rss_entries(feed_data) is not None
+        fast = rss_parser._parse_feed(feed_data, 'Test Feed', legacy_ids=True)
+        with patch('rss_parser.etree', None):
+            slow = rss_parser._parse_feed(feed_data, 'Test Feed', legacy_ids=True)
+
+        assert fast == slow
+        assert len(fast[0]) == 2
+
+    def test_parse_feed_stops_at_max_items(self):
+        """Test that only the first max_items matching entries of a newest-first feed are kept"""
+        feed_data = _dated_feed([1, 2, 3, 4, 5])
+
+        _, titles, _, _, _, _ = rss_parser._parse_feed(feed_data, 'Test Feed', max_items=3)
+        assert titles == ['AI 0', 'AI 1', 'AI 2']
+
+    def test_parse_feed_reads_oldest_first_feed_to_the_end(self):
+        """Test that the item cap does not hide the newest entries of an oldest-first feed"""
+        feed_data = _dated_feed([5, 4, 3, 2, 1])
+
+        _, titles, _, _, _, _ = rss_parser._parse_feed(feed_data, 'Test Feed', max_items=3)
+        assert titles == ['AI 0', 'AI 1', 'AI 2', 'AI 3', 'AI 4']
+
+    def test_parse_feed_ignores_max_items_for_undated_entries(self):
+        """Test that feeds whose order cannot be checked are read in full"""
+        items = b''.join(
+            b'<item><title>AI %d</title><link>https://example.com/%d</link></item>' % (i, i)
+            for i in range(5)
+        )
+        feed_data = b'<rss version="2.0"><channel>' + items + b'</channel></rss>'
+
+        _, titles, _, _, _, _ = rss_parser._parse_feed(feed_data, 'Test Feed', max_items=3)
+        assert len(titles) == 5
+
+    def test_lxml_fast_path_defers_atom_to_feedparser(self):
+        """Test that feeds other than plain RSS are left to feedparser"""
+        feed_data = b"""<?xml version="1.0"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry><title>Atom Entry</title><link href="https://example.com/atom"/></entry>
+        </feed>"""
+
+        assert rss_parser._rss_entries(feed_data) is None
+        ids, titles, links, _, _, _ = rss_parser._parse_feed(feed_data, 'Test Feed')
+        assert titles == ['Atom Entry']
+        assert links == ['https://example.com/atom']
+
+    def test_process_feed_entries_adopts_legacy_md5_ids(self, mock_config_file):
+        """Test that entries cached under MD5 ids are still treated as seen"""
+        parser = AsyncRSSParser(config_file=mock_config_file)
+        legacy_id = hashlib.md5(b'Old Articlehttps://example.com/old').hexdigest()
+        parser.seen_entries = {legacy_id: 1700000000.0}
+        parser._legacy_seen_ids = {legacy_id}
+        
+        feed_data = b"""<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <item>
+                    <title>Old Article</title>
+                    <link>https://example.com/old</link>
+                </item>
+            </channel>
+        </rss>"""
+        
+        entries = parser._process_feed_entries(
+            feed_data=feed_data,
+            feed_url='https://example.com/feed.xml',
+            feed_name='Test Feed',
+            category='test',
+            use_cache=True
+        )
+        
+        assert entries == []
+        new_id = parser._generate_entry_id({'title': 'Old Article', 'link': 'https://example.com/old'})
+        assert parser.seen_entries == {new_id: 1700000000.0}
+    
     def test_process_feed_entries_without_cache(self, mock_config_file):
         """Test processing feed entries without cache"""
         parser = AsyncRSSParser(config_file=mock_config_file)
@@ -214,8 +347,8 @@ class TestAsyncRSSParser:
         </rss>"""
         
         # Mock the fetch method
-        async def mock_fetch(*args):
-            return feed_data
+        async def mock_fetch(*args, **kwargs):
+            return feed_data, (None, None)
         
         with patch.object(parser, '_fetch_feed_with_retry', side_effect=mock_fetch):
             entries = await parser.parse_multiple_feeds_async(
@@ -235,10 +368,10 @@ class TestAsyncRSSParser:
         parser = AsyncRSSParser(config_file=mock_config_file)
         
         # Make first feed fail, second succeed
-        async def mock_fetch(session, url, name):
+        async def mock_fetch(session, url, name, conditional=False):
             if 'feed1' in url:
                 raise Exception("Feed 1 error")
-            return b'<rss><channel><item><title>Success</title></item></channel></rss>'
+            return b'<rss><channel><item><title>Success</title></item></channel></rss>', (None, None)
         
         with patch.object(parser, '_fetch_feed_with_retry', side_effect=mock_fetch):
             entries = await parser.parse_multiple_feeds_async()
@@ -247,6 +380,69 @@ class TestAsyncRSSParser:
         assert len(entries) == 1
         assert entries[0]['title'] == 'Success'
     
+    @pytest.mark.asyncio
+    async def test_feed_validators_stored_only_after_processing(self, mock_config_file):
+        """Test that a failed parse or new keywords never leave a feed behind a 304"""
+        parser = AsyncRSSParser(config_file=mock_config_file)
+        feed = {'url': 'https://example.com/feed1.xml', 'name': 'Test Feed 1'}
+        feed_data = (b'<rss version="2.0"><channel>'
+                     b'<item><title>AI</title><link>https://example.com/ai</link></item>'
+                     b'</channel></rss>')
+
+        validators_at_fetch = []
+
+        async def mock_fetch(*args, **kwargs):
+            validators_at_fetch.append(dict(parser._feed_validators))
+            return feed_data, ('"v1"', None)
+
+        try:
+            with patch.object(parser, '_fetch_feed_with_retry', side_effect=mock_fetch):
+                with patch.object(parser, '_filter_seen', side_effect=RuntimeError("parse failed")):
+                    with pytest.raises(RuntimeError):
+                        await parser.parse_feed_async(None, feed, ['ai'])
+                assert parser._feed_validators == {}
+
+                await parser.parse_feed_async(None, feed, ['ai'])
+                assert parser._feed_validators == {feed['url']: ('"v1"', None)}
+
+                # Reloaded keywords may match entries the last fetch filtered out
+                await parser.parse_feed_async(None, feed, ['ml'])
+                assert validators_at_fetch[-1] == {}
+        finally:
+            await parser.close()
+
+    def test_cache_log_replayed_and_compacted(self, mock_config_file, mock_feed_cache):
+        """Test that flushed entries survive a restart and compaction folds them into the snapshot"""
+        parser = AsyncRSSParser(
+            cache_file=mock_feed_cache,
+            config_file=mock_config_file
+        )
+        parser.seen_entries['ghi789'] = 1700000000.0
+        parser._pending_cache_lines.append("ghi789\t1700000000.0\n")
+        parser._flush_cache()
+
+        reloaded = AsyncRSSParser(cache_file=mock_feed_cache, config_file=mock_config_file)
+        assert set(reloaded.seen_entries) == {'abc123', 'def456', 'ghi789'}
+
+        reloaded._compact_cache()
+        with open(reloaded.cache_log_file) as f:
+            assert f.read() == ''
+        compacted = AsyncRSSParser(cache_file=mock_feed_cache, config_file=mock_config_file)
+        assert compacted.seen_entries == reloaded.seen_entries
+
+    def test_seen_entries_capped_least_recently_seen_first(self, mock_config_file):
+        """Test that the seen cache drops the entries not seen for longest once full"""
+        parser = AsyncRSSParser(config_file=mock_config_file)
+        parser.seen_entries.clear()
+
+        with patch('rss_parser._SEEN_ENTRIES_MAX', 2):
+            parser._mark_seen('first', 1.0)
+            parser._mark_seen('second', 2.0)
+            parser._filter_seen('Test Feed', 'test', (['first'], ['t'], ['l'], [''], [None], [None]), True)
+            parser._mark_seen('third', 3.0)
+
+        assert list(parser.seen_entries) == ['first', 'third']
+
     def test_get_feeds_from_config(self, mock_config_file):
         """Test getting feeds from config"""
         parser = AsyncRSSParser(config_file=mock_config_file)
@@ -0,0 +1,27 @@
+import pytest
+from unittest.mock import patch
+
+from slack_bot import AINewsSlackBot
+
+
+@pytest.mark.unit
+class TestAINewsSlackBot:
+    @pytest.fixture
+    def bot(self):
+        """Create a bot without Slack or file-backed managers"""
+        with patch('slack_bot.AsyncApp'), patch('slack_bot.ConfigManager'), \
+                patch('slack_bot.FeedbackManager'), \
+                patch.object(AINewsSlackBot, '_register_handlers'):
+            bot = AINewsSlackBot('xoxb-test', 'xapp-test', 'C123')
+        bot.feedback_manager.get_article_feedback_summary.return_value = {}
+        return bot
+
+    def test_format_article_block_returns_independent_copies(self, bot, sample_article):
+        """Test that editing returned blocks does not change the cached blocks"""
+        blocks = bot.format_article_block(sample_article)
+        blocks[0]['text']['text'] = 'edited'
+        blocks[-2]['elements'][0]['value'] = 'edited'
+
+        again = bot.format_article_block(sample_article)
+        assert again[0]['text']['text'] == '*<https://example.com/article|Test AI Article>*'
+        assert again[-2]['elements'][0]['value'] != 'edited'